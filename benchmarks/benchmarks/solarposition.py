@@ -4,17 +4,8 @@ ASV benchmarks for solarposition.py
 
 import datetime
 import pandas as pd
-import pvlib
 from pvlib import solarposition
 
-from packaging.version import Version
-
-
-if Version(pvlib.__version__) >= Version('0.6.1'):
-    sun_rise_set_transit_spa = solarposition.sun_rise_set_transit_spa
-else:
-    sun_rise_set_transit_spa = solarposition.get_sun_rise_set_transit
-
 
 class SolarPosition:
     params = [1, 10, 100]  # number of days
@@ -44,7 +35,8 @@ class SolarPosition:
         solarposition.pyephem(self.times_localized, self.lat, self.lon)
 
     def time_sun_rise_set_transit_spa(self, ndays):
-        sun_rise_set_transit_spa(self.times_daily, self.lat, self.lon)
+        solarposition.sun_rise_set_transit_spa(
+            self.times_daily, self.lat, self.lon)
 
     def time_sun_rise_set_transit_ephem(self, ndays):
         solarposition.sun_rise_set_transit_ephem(
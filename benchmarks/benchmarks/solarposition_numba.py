@@ -7,23 +7,15 @@ code during setup.
 Try to keep relevant sections in sync with benchmarks/solarposition.py
 """
 
-from packaging.version import Version
 import pandas as pd
 
 import os
 os.environ['PVLIB_USE_NUMBA'] = '1'
 
 
-import pvlib  # NOQA: E402
 from pvlib import solarposition  # NOQA: E402
 
 
-if Version(pvlib.__version__) >= Version('0.6.1'):
-    sun_rise_set_transit_spa = solarposition.sun_rise_set_transit_spa
-else:
-    sun_rise_set_transit_spa = solarposition.get_sun_rise_set_transit
-
-
 class SolarPositionNumba:
     params = [1, 10, 100]  # number of days
     param_names = ['ndays']
@@ -42,5 +34,5 @@ class SolarPositionNumba:
             self.times_localized, self.lat, self.lon, how='numba')
 
     def time_sun_rise_set_transit_spa(self, ndays):
-        sun_rise_set_transit_spa(
+        solarposition.sun_rise_set_transit_spa(
             self.times_daily, self.lat, self.lon, how='numba')
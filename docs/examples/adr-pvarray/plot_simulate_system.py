@@ -55,19 +55,26 @@ solpos = loc.get_solarposition(df.index)
 TILT = metadata['latitude']
 ORIENT = 180
 
+# The model functions accept plain numpy arrays as well as pandas objects.
+# Working with arrays avoids index alignment in every operation, so we
+# extract them once here and collect the results in a DataFrame later.
+
+ghi, dhi, dni = df['ghi'].values, df['dhi'].values, df['dni'].values
+temp_air, wind_speed = df['temp_air'].values, df['wind_speed'].values
+
 total_irrad = get_total_irradiance(TILT, ORIENT,
-                                   solpos.apparent_zenith, solpos.azimuth,
-                                   df.dni, df.ghi, df.dhi)
+                                   solpos.apparent_zenith.values,
+                                   solpos.azimuth.values,
+                                   dni, ghi, dhi)
 
-df['poa_global'] = total_irrad.poa_global
+poa_global = total_irrad['poa_global']
 
 # %%
 #
 # Estimate the expected operating temperature of the PV modules
 #
 
-df['temp_pv'] = pvlib.temperature.faiman(df.poa_global, df.temp_air,
-                                         df.wind_speed)
+temp_pv = pvlib.temperature.faiman(poa_global, temp_air, wind_speed)
 
 # %%
 #
@@ -96,7 +103,7 @@ adr_params = {'k_a': 0.99924,
               'k_rsh': 0.26144
               }
 
-df['eta_rel'] = pvefficiency_adr(df['poa_global'], df['temp_pv'], **adr_params)
+eta_rel = pvefficiency_adr(poa_global, temp_pv, **adr_params)
 
 # Set the desired array size:
 P_STC = 5000.   # (W)
@@ -104,7 +111,14 @@ P_STC = 5000.   # (W)
 # and the irradiance level needed to achieve this output:
 G_STC = 1000.   # (W/m2)
 
-df['p_mp'] = P_STC * df['eta_rel'] * (df['poa_global'] / G_STC)
+p_mp = P_STC * eta_rel * (poa_global / G_STC)
+
+# Collect the results for plotting:
+
+df['poa_global'] = poa_global
+df['temp_pv'] = temp_pv
+df['eta_rel'] = eta_rel
+df['p_mp'] = p_mp
 
 # %%
 #
@@ -22,7 +22,6 @@ Illustrates how to fit an IAM model to data using :py:func:`~pvlib.iam.fit`.
 # a custom weight function to :py:func:`~pvlib.iam.fit`.
 
 import numpy as np
-from random import uniform
 import matplotlib.pyplot as plt
 
 from pvlib.tools import cosd
@@ -42,7 +41,8 @@ from pvlib.iam import (martin_ruiz, physical, fit)
 aoi = np.linspace(0, 85, 10)
 params = {'a_r': 0.16}
 iam = martin_ruiz(aoi, **params)
-data = iam * np.array([uniform(0.98, 1.02) for _ in range(len(iam))])
+rng = np.random.default_rng(0)
+data = iam * rng.uniform(0.98, 1.02, size=iam.shape)
 
 # Get parameters for the physical model by fitting to the perturbed data.
 physical_params = fit(aoi, data, 'physical')
@@ -68,21 +68,24 @@ tz = 'Etc/GMT+5'
 loc = location.Location(lat, lon, tz=tz, name='Greensboro, NC')
 
 # Calculate solar position parameters
+times = meteo.index.shift(freq="-30min")
+pressure = meteo.pressure*100  # convert from millibar to Pa
 solpos = loc.get_solarposition(
-    meteo.index.shift(freq="-30min"),
-    pressure=meteo.pressure*100,  # convert from millibar to Pa
+    times,
+    pressure=pressure,
     temperature=meteo.temp_air)
 solpos.index = meteo.index  # reset index to end of the hour
 
 airmass_relative = pvlib.atmosphere.get_relative_airmass(
     solpos.apparent_zenith).dropna()
 airmass_absolute = pvlib.atmosphere.get_absolute_airmass(airmass_relative,
-                                                         meteo.pressure*100)
+                                                         pressure)
 # %%
 # Now we calculate the clearsky index, :math:`k_c`, which is the ratio of GHI
 # to clearsky GHI.
 
-cs = loc.get_clearsky(meteo.index.shift(freq="-30min"))
+# reuse the solar position calculated above, at the centre of the interval
+cs = loc.get_clearsky(times, solar_position=solpos.set_axis(times))
 cs.index = meteo.index  # reset index to end of the hour
 kc = pvlib.irradiance.clearsky_index(meteo.ghi, cs.ghi)
 # %%
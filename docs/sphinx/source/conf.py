@@ -18,14 +18,20 @@ import os
 import warnings
 
 # for generating GH links with linenumbers
+import functools
+import importlib
 import inspect
 
-# import distutils before calling pd.show_versions()
-# https://github.com/pypa/setuptools/issues/3044
-import distutils  # noqa: F401
-import pandas as pd
+# print the versions of the build dependencies on Read the Docs, or locally
+# when requested; pd.show_versions() imports many optional packages, which
+# slows down every sphinx-build invocation (and every parallel worker)
+if os.environ.get('READTHEDOCS') or os.environ.get('PVLIB_DOCS_SHOW_VERSIONS'):
+    # import distutils before calling pd.show_versions()
+    # https://github.com/pypa/setuptools/issues/3044
+    import distutils  # noqa: F401
+    import pandas as pd
 
-pd.show_versions()
+    pd.show_versions()
 
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
@@ -388,18 +394,26 @@ sphinx_gallery_conf = {
 
     # https://sphinx-gallery.github.io/dev/configuration.html#removing-config-comments  # noqa: E501
     'remove_config_comments': True,
+
+    # run the example scripts with as many processes as ``sphinx-build -j``
+    'parallel': True,
 }
 # supress warnings in gallery output
 # https://sphinx-gallery.github.io/stable/configuration.html
 warnings.filterwarnings("ignore", category=UserWarning,
                         message='Matplotlib is currently using agg, which is a'
                                 ' non-GUI backend, so cannot show the figure.')
+# joblib warns when it restarts a worker of the parallel gallery build
+warnings.filterwarnings("ignore", category=UserWarning,
+                        message='A worker stopped while some jobs were given '
+                                'to the executor.')
 
 # %% helper functions for intelligent "View on Github" linking
 # based on
 # https://gist.github.com/flying-sheep/b65875c0ce965fbdd1d9e5d0b9851ef1
 
 
+@functools.lru_cache(maxsize=None)
 def get_obj_module(qualname):
     """
     Get a module/class/attribute and its original module by qualname.
@@ -415,9 +429,16 @@ def get_obj_module(qualname):
     modname = qualname
     classname = None
     attrname = None
-    while modname not in sys.modules:
-        attrname = classname
-        modname, classname = modname.rsplit('.', 1)
+    # pvlib imports its submodules lazily, so import rather than only
+    # looking in sys.modules
+    while True:
+        try:
+            importlib.import_module(modname)
+        except ImportError:
+            attrname = classname
+            modname, classname = modname.rsplit('.', 1)
+        else:
+            break
 
     # retrieve object and find original module name
     if classname:
@@ -444,6 +465,7 @@ def get_linenos(obj):
         return start, start + len(lines) - 1
 
 
+@functools.lru_cache(maxsize=None)
 def make_github_url(file_name):
     """
     Generate the appropriate GH link for a given docs page.  This function
@@ -1,30 +1,43 @@
+import importlib
+
 from pvlib.version import __version__  # noqa: F401
 
-from pvlib import (  # noqa: F401
-    # list spectrum first so it's available for atmosphere & pvsystem (GH 1628)
-    spectrum,
+# submodules are imported on first attribute access (PEP 562), so that
+# ``import pvlib`` doesn't import every submodule and its dependencies
+_submodules = [
+    'albedo',
+    'atmosphere',
+    'bifacial',
+    'clearsky',
+    'iam',
+    'inverter',
+    'iotools',
+    'irradiance',
+    'ivtools',
+    'location',
+    'modelchain',
+    'pvarray',
+    'pvsystem',
+    'scaling',
+    'shading',
+    'singlediode',
+    'snow',
+    'soiling',
+    'solarposition',
+    'spa',
+    'spectrum',
+    'temperature',
+    'tools',
+    'tracking',
+]
+__all__ = list(_submodules)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'pvlib.{name}')
+    raise AttributeError(f"module 'pvlib' has no attribute '{name}'")
+
 
-    albedo,
-    atmosphere,
-    bifacial,
-    clearsky,
-    iam,
-    inverter,
-    iotools,
-    irradiance,
-    ivtools,
-    location,
-    modelchain,
-    pvarray,
-    pvsystem,
-    scaling,
-    shading,
-    singlediode,
-    snow,
-    soiling,
-    solarposition,
-    spa,
-    temperature,
-    tools,
-    tracking,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -0,0 +1,28 @@
+from pvlib.version import __version__ as __version__
+
+from pvlib import (
+    albedo as albedo,
+    atmosphere as atmosphere,
+    bifacial as bifacial,
+    clearsky as clearsky,
+    iam as iam,
+    inverter as inverter,
+    iotools as iotools,
+    irradiance as irradiance,
+    ivtools as ivtools,
+    location as location,
+    modelchain as modelchain,
+    pvarray as pvarray,
+    pvsystem as pvsystem,
+    scaling as scaling,
+    shading as shading,
+    singlediode as singlediode,
+    snow as snow,
+    soiling as soiling,
+    solarposition as solarposition,
+    spa as spa,
+    spectrum as spectrum,
+    temperature as temperature,
+    tools as tools,
+    tracking as tracking,
+)
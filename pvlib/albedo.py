@@ -2,7 +2,8 @@
 The ``albedo`` module contains functions for modeling albedo.
 """
 
-from pvlib.tools import sind
+import math
+
 import numpy as np
 import pandas as pd
 
@@ -156,11 +157,28 @@ def inland_water_dvoracek(solar_elevation, surface_condition=None,
             " a combination of `color_coeff` and"
             " `wave_roughness_coeff`.")
 
-    solar_elevation_positive = np.where(solar_elevation < 0, 0,
+    if (np.isscalar(solar_elevation) and np.isscalar(color_coeff)
+            and np.isscalar(wave_roughness_coeff)):
+        # skip the overhead of numpy functions for scalar input
+        solar_elevation_positive = max(solar_elevation, 0)
+        return np.float64(color_coeff ** (
+            wave_roughness_coeff
+            * math.sin(math.radians(solar_elevation_positive)) + 1))
+
+    solar_elevation_positive = np.where(solar_elevation < 0, 0.,
                                         solar_elevation)
 
-    albedo = color_coeff ** (wave_roughness_coeff *
-                             sind(solar_elevation_positive) + 1)
+    # solar_elevation_positive is a new array, so compute the sine in place
+    sin_elevation = np.sin(np.radians(solar_elevation_positive,
+                                      out=solar_elevation_positive),
+                           out=solar_elevation_positive)
+
+    exponent = wave_roughness_coeff * sin_elevation + 1
+    if np.isscalar(color_coeff) and color_coeff > 0:
+        # for a constant base, exp(k * log(c)) is much faster than c**k
+        albedo = np.exp(math.log(color_coeff) * exponent)
+    else:
+        albedo = color_coeff ** exponent
 
     if isinstance(solar_elevation, pd.Series):
         albedo = pd.Series(albedo, index=solar_elevation.index)
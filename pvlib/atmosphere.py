@@ -234,11 +234,10 @@ def get_relative_airmass(zenith, model='kastenyoung1989'):
         sec_zen = 1.0 / np.cos(zenith_rad)
         am = sec_zen * (1 - 0.0012 * (sec_zen * sec_zen - 1))
     elif 'young1994' == model:
-        am = ((1.002432*((np.cos(zenith_rad)) ** 2) +
-              0.148386*(np.cos(zenith_rad)) + 0.0096467) /
-              (np.cos(zenith_rad) ** 3 +
-              0.149864*(np.cos(zenith_rad) ** 2) +
-              0.0102963*(np.cos(zenith_rad)) + 0.000303978))
+        cos_zen = np.cos(zenith_rad)
+        am = ((1.002432*(cos_zen ** 2) + 0.148386*cos_zen + 0.0096467) /
+              (cos_zen ** 3 + 0.149864*(cos_zen ** 2) +
+              0.0102963*cos_zen + 0.000303978))
     elif 'gueymard1993' == model:
         am = (1.0 / (np.cos(zenith_rad) +
               0.00176759*(z)*((94.37515 - z) ** - 1.21563)))
@@ -120,7 +120,7 @@ def _poa_ground_pv(poa_ground, gcr, surface_tilt):
 
 
 def _shaded_fraction(solar_zenith, solar_azimuth, surface_tilt,
-                     surface_azimuth, gcr):
+                     surface_azimuth, gcr, tan_phi=None):
     """
     Calculate fraction (from the bottom) of row slant height that is shaded
     from direct irradiance by the row in front toward the sun.
@@ -149,6 +149,10 @@ def _shaded_fraction(solar_zenith, solar_azimuth, surface_tilt,
     gcr : numeric
         Ground coverage ratio, which is the ratio of row slant length to row
         spacing (pitch). [unitless]
+    tan_phi : numeric, optional
+        Tangent of the projected solar zenith angle, see
+        :py:func:`pvlib.bifacial.utils._solar_projection_tangent`. Calculated
+        if not provided. [unitless]
 
     Returns
     -------
@@ -166,8 +170,9 @@ def _shaded_fraction(solar_zenith, solar_azimuth, surface_tilt,
        Single-Axis Trackers", Technical Report NREL/TP-5K00-76626, July 2020.
        https://www.nrel.gov/docs/fy20osti/76626.pdf
     """
-    tan_phi = utils._solar_projection_tangent(
-        solar_zenith, solar_azimuth, surface_azimuth)
+    if tan_phi is None:
+        tan_phi = utils._solar_projection_tangent(
+            solar_zenith, solar_azimuth, surface_azimuth)
     # length of shadow behind a row as a fraction of pitch
     x = gcr * (sind(surface_tilt) * tan_phi + cosd(surface_tilt))
     f_x = 1 - 1. / x
@@ -179,6 +184,119 @@ def _shaded_fraction(solar_zenith, solar_azimuth, surface_tilt,
     return f_x
 
 
+def _circumsolar_adjustment(model, dhi, dni, dni_extra, solar_zenith,
+                            solar_azimuth):
+    """
+    Move circumsolar diffuse irradiance from DHI to DNI for the
+    ``'haydavies'`` model. DHI and DNI are returned unchanged for the
+    ``'isotropic'`` model.
+    """
+    if model == 'haydavies':
+        if dni_extra is None:
+            raise ValueError(f'must supply dni_extra for {model} model')
+        # Call haydavies first time within the horizontal plane - to subtract
+        # circumsolar_horizontal from DHI
+        sky_diffuse_comps_horizontal = haydavies(0, 180, dhi, dni, dni_extra,
+                                                 solar_zenith, solar_azimuth,
+                                                 return_components=True)
+        circumsolar_horizontal = sky_diffuse_comps_horizontal['circumsolar']
+
+        # Call haydavies a second time where circumsolar_normal is facing
+        # directly towards sun, and can be added to DNI
+        sky_diffuse_comps_normal = haydavies(solar_zenith, solar_azimuth, dhi,
+                                             dni, dni_extra, solar_zenith,
+                                             solar_azimuth,
+                                             return_components=True)
+        circumsolar_normal = sky_diffuse_comps_normal['circumsolar']
+
+        dhi = dhi - circumsolar_horizontal
+        dni = dni + circumsolar_normal
+    return dhi, dni
+
+
+def _ground_diffuse(surface_tilt, surface_azimuth, solar_zenith,
+                    solar_azimuth, gcr, height, pitch, ghi, dhi, albedo,
+                    npoints, vectorize, tan_phi):
+    """
+    Irradiance reflected from the ground between rows, reduced for the
+    shadows of the rows. See :py:func:`get_irradiance_poa` for parameters.
+    """
+    # Calculate some geometric quantities
+    # rows to consider in front and behind current row
+    # ensures that view factors to the sky are computed to within 5 degrees
+    # of the horizon
+    max_rows = np.ceil(height / (pitch * tand(5)))
+    # fraction of ground between rows that is illuminated accounting for
+    # shade from panels. [1], Eq. 4
+    f_gnd_beam = utils._unshaded_ground_fraction(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, gcr,
+        tan_phi=tan_phi)
+    # integrated view factor from the ground to the sky, integrated between
+    # adjacent rows interior to the array
+    # method differs from [1], Eq. 7 and Eq. 8; height is defined at row
+    # center rather than at row lower edge as in [1].
+    vf_gnd_sky = utils.vf_ground_sky_2d_integ(
+        surface_tilt, gcr, height, pitch, max_rows, npoints,
+        vectorize)
+
+    # irradiance reflected from the ground before accounting for shadows
+    # and restricted views
+    # this is a deviation from [1], because the row to ground view factor
+    # is accounted for in a different manner
+    ground_diffuse = ghi * albedo
+
+    # diffuse fraction
+    diffuse_fraction = np.clip(dhi / ghi, 0., 1.)
+    # make diffuse fraction 0 when ghi is small
+    diffuse_fraction = np.where(ghi < 0.0001, 0., diffuse_fraction)
+
+    # Reduce ground-reflected irradiance because other rows in the array
+    # block irradiance from reaching the ground.
+    # [2], Eq. 9
+    return _poa_ground_shadows(
+        ground_diffuse, f_gnd_beam, diffuse_fraction, vf_gnd_sky)
+
+
+def _poa_row(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+             gcr, dhi, dni, iam, ground_diffuse, tan_phi):
+    """
+    Plane-of-array irradiance components on one side of a row, given the
+    shaded ground-reflected irradiance from :py:func:`_ground_diffuse`.
+    See :py:func:`get_irradiance_poa` for parameters and output.
+    """
+    # fraction of row slant height that is shaded from direct irradiance
+    f_x = _shaded_fraction(solar_zenith, solar_azimuth, surface_tilt,
+                           surface_azimuth, gcr, tan_phi=tan_phi)
+
+    # Total sky diffuse received by both shaded and unshaded portions
+    poa_sky_pv = _poa_sky_diffuse_pv(dhi, gcr, surface_tilt)
+
+    # Ground-reflected irradiance on the row surface accounting for
+    # the view to the ground. This deviates from [1], Eq. 10, 11 and
+    # subsequent. Here, the row to ground view factor is computed. In [1],
+    # the usual ground-reflected irradiance includes the single row to ground
+    # view factor (1 - cos(tilt))/2, and Eq. 10, 11 and later multiply
+    # this quantity by a ratio of view factors.
+    poa_gnd_pv = _poa_ground_pv(ground_diffuse, gcr, surface_tilt)
+
+    # add sky and ground-reflected irradiance on the row by irradiance
+    # component
+    poa_diffuse = poa_gnd_pv + poa_sky_pv
+    # beam on plane, make an array for consistency with poa_diffuse
+    poa_beam = np.atleast_1d(beam_component(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, dni))
+    poa_direct = poa_beam * (1 - f_x) * iam  # direct only on the unshaded part
+    poa_global = poa_direct + poa_diffuse
+
+    output = {
+        'poa_global': poa_global, 'poa_direct': poa_direct,
+        'poa_diffuse': poa_diffuse, 'poa_ground_diffuse': poa_gnd_pv,
+        'poa_sky_diffuse': poa_sky_pv, 'shaded_fraction': f_x}
+    if isinstance(poa_global, pd.Series):
+        output = pd.DataFrame(output)
+    return output
+
+
 def get_irradiance_poa(surface_tilt, surface_azimuth, solar_zenith,
                        solar_azimuth, gcr, height, pitch, ghi, dhi, dni,
                        albedo, model='isotropic', dni_extra=None, iam=1.0,
@@ -290,91 +408,18 @@ def get_irradiance_poa(surface_tilt, surface_azimuth, solar_zenith,
     --------
     get_irradiance
     """
-    if model == 'haydavies':
-        if dni_extra is None:
-            raise ValueError(f'must supply dni_extra for {model} model')
-        # Call haydavies first time within the horizontal plane - to subtract
-        # circumsolar_horizontal from DHI
-        sky_diffuse_comps_horizontal = haydavies(0, 180, dhi, dni, dni_extra,
-                                                 solar_zenith, solar_azimuth,
-                                                 return_components=True)
-        circumsolar_horizontal = sky_diffuse_comps_horizontal['circumsolar']
-
-        # Call haydavies a second time where circumsolar_normal is facing
-        # directly towards sun, and can be added to DNI
-        sky_diffuse_comps_normal = haydavies(solar_zenith, solar_azimuth, dhi,
-                                             dni, dni_extra, solar_zenith,
-                                             solar_azimuth,
-                                             return_components=True)
-        circumsolar_normal = sky_diffuse_comps_normal['circumsolar']
-
-        dhi = dhi - circumsolar_horizontal
-        dni = dni + circumsolar_normal
-
-    # Calculate some geometric quantities
-    # rows to consider in front and behind current row
-    # ensures that view factors to the sky are computed to within 5 degrees
-    # of the horizon
-    max_rows = np.ceil(height / (pitch * tand(5)))
-    # fraction of ground between rows that is illuminated accounting for
-    # shade from panels. [1], Eq. 4
-    f_gnd_beam = utils._unshaded_ground_fraction(
-        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, gcr)
-    # integrated view factor from the ground to the sky, integrated between
-    # adjacent rows interior to the array
-    # method differs from [1], Eq. 7 and Eq. 8; height is defined at row
-    # center rather than at row lower edge as in [1].
-    vf_gnd_sky = utils.vf_ground_sky_2d_integ(
-        surface_tilt, gcr, height, pitch, max_rows, npoints,
-        vectorize)
-    # fraction of row slant height that is shaded from direct irradiance
-    f_x = _shaded_fraction(solar_zenith, solar_azimuth, surface_tilt,
-                           surface_azimuth, gcr)
-
-    # Total sky diffuse received by both shaded and unshaded portions
-    poa_sky_pv = _poa_sky_diffuse_pv(dhi, gcr, surface_tilt)
-
-    # irradiance reflected from the ground before accounting for shadows
-    # and restricted views
-    # this is a deviation from [1], because the row to ground view factor
-    # is accounted for in a different manner
-    ground_diffuse = ghi * albedo
-
-    # diffuse fraction
-    diffuse_fraction = np.clip(dhi / ghi, 0., 1.)
-    # make diffuse fraction 0 when ghi is small
-    diffuse_fraction = np.where(ghi < 0.0001, 0., diffuse_fraction)
-
-    # Reduce ground-reflected irradiance because other rows in the array
-    # block irradiance from reaching the ground.
-    # [2], Eq. 9
-    ground_diffuse = _poa_ground_shadows(
-        ground_diffuse, f_gnd_beam, diffuse_fraction, vf_gnd_sky)
-
-    # Ground-reflected irradiance on the row surface accounting for
-    # the view to the ground. This deviates from [1], Eq. 10, 11 and
-    # subsequent. Here, the row to ground view factor is computed. In [1],
-    # the usual ground-reflected irradiance includes the single row to ground
-    # view factor (1 - cos(tilt))/2, and Eq. 10, 11 and later multiply
-    # this quantity by a ratio of view factors.
-    poa_gnd_pv = _poa_ground_pv(ground_diffuse, gcr, surface_tilt)
-
-    # add sky and ground-reflected irradiance on the row by irradiance
-    # component
-    poa_diffuse = poa_gnd_pv + poa_sky_pv
-    # beam on plane, make an array for consistency with poa_diffuse
-    poa_beam = np.atleast_1d(beam_component(
-        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, dni))
-    poa_direct = poa_beam * (1 - f_x) * iam  # direct only on the unshaded part
-    poa_global = poa_direct + poa_diffuse
-
-    output = {
-        'poa_global': poa_global, 'poa_direct': poa_direct,
-        'poa_diffuse': poa_diffuse, 'poa_ground_diffuse': poa_gnd_pv,
-        'poa_sky_diffuse': poa_sky_pv, 'shaded_fraction': f_x}
-    if isinstance(poa_global, pd.Series):
-        output = pd.DataFrame(output)
-    return output
+    dhi, dni = _circumsolar_adjustment(model, dhi, dni, dni_extra,
+                                       solar_zenith, solar_azimuth)
+    # tangent of the solar zenith projected onto the plane perpendicular to
+    # the rows, needed for both ground and row shading
+    tan_phi = utils._solar_projection_tangent(
+        solar_zenith, solar_azimuth, surface_azimuth)
+    ground_diffuse = _ground_diffuse(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, gcr,
+        height, pitch, ghi, dhi, albedo, npoints, vectorize, tan_phi)
+    return _poa_row(surface_tilt, surface_azimuth, solar_zenith,
+                    solar_azimuth, gcr, dhi, dni, iam, ground_diffuse,
+                    tan_phi)
 
 
 def get_irradiance(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
@@ -532,20 +577,25 @@ def get_irradiance(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
     """
     # backside is rotated and flipped relative to front
     backside_tilt, backside_sysaz = _backside(surface_tilt, surface_azimuth)
+    dhi, dni = _circumsolar_adjustment(model, dhi, dni, dni_extra,
+                                       solar_zenith, solar_azimuth)
+    tan_phi = utils._solar_projection_tangent(
+        solar_zenith, solar_azimuth, surface_azimuth)
     # front side POA irradiance
-    irrad_front = get_irradiance_poa(
-        surface_tilt=surface_tilt, surface_azimuth=surface_azimuth,
-        solar_zenith=solar_zenith, solar_azimuth=solar_azimuth,
-        gcr=gcr, height=height, pitch=pitch, ghi=ghi, dhi=dhi, dni=dni,
-        albedo=albedo, model=model, dni_extra=dni_extra, iam=iam_front,
-        npoints=npoints, vectorize=vectorize)
-    # back side POA irradiance
-    irrad_back = get_irradiance_poa(
-        surface_tilt=backside_tilt, surface_azimuth=backside_sysaz,
-        solar_zenith=solar_zenith, solar_azimuth=solar_azimuth,
-        gcr=gcr, height=height, pitch=pitch, ghi=ghi, dhi=dhi, dni=dni,
-        albedo=albedo, model=model, dni_extra=dni_extra, iam=iam_back,
-        npoints=npoints, vectorize=vectorize)
+    ground_diffuse = _ground_diffuse(
+        surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, gcr,
+        height, pitch, ghi, dhi, albedo, npoints, vectorize, tan_phi)
+    irrad_front = _poa_row(surface_tilt, surface_azimuth, solar_zenith,
+                           solar_azimuth, gcr, dhi, dni, iam_front,
+                           ground_diffuse, tan_phi)
+    # back side POA irradiance; the backside azimuth is rotated by 180
+    # degrees, which changes the sign of the projected zenith tangent
+    ground_diffuse_back = _ground_diffuse(
+        backside_tilt, backside_sysaz, solar_zenith, solar_azimuth, gcr,
+        height, pitch, ghi, dhi, albedo, npoints, vectorize, -tan_phi)
+    irrad_back = _poa_row(backside_tilt, backside_sysaz, solar_zenith,
+                          solar_azimuth, gcr, dhi, dni, iam_back,
+                          ground_diffuse_back, -tan_phi)
 
     colmap_front = {
         'poa_global': 'poa_front',
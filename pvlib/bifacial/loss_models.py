@@ -148,16 +148,17 @@ def power_mismatch_deline(
        https://en.wikipedia.org/wiki/Mean_absolute_difference#Relative_mean_absolute_difference
        (accessed 2024-04-14).
     """  # noqa: E501
+    # evaluate on the underlying array, the Series is rebuilt at the end
+    x = rmad.values if isinstance(rmad, pd.Series) else rmad
     if isinstance(coefficients, np.polynomial.Polynomial):
-        model_polynom = coefficients
+        mismatch = coefficients(x)
     else:  # expect an iterable
-        model_polynom = np.polynomial.Polynomial(coef=coefficients)
+        # evaluate the coefficients directly rather than creating a Polynomial
+        mismatch = np.polynomial.polynomial.polyval(x, coefficients)
 
     if fill_factor:  # Eq. (7), [1]
         # Scale output of trained model to account for different fill factors
-        model_polynom = model_polynom * fill_factor / fill_factor_reference
-
-    mismatch = model_polynom(rmad)
+        mismatch = mismatch * (fill_factor / fill_factor_reference)
     if isinstance(rmad, pd.Series):
         mismatch = pd.Series(mismatch, index=rmad.index)
     return mismatch
@@ -38,7 +38,7 @@ def _solar_projection_tangent(solar_zenith, solar_azimuth, surface_azimuth):
 
 
 def _unshaded_ground_fraction(surface_tilt, surface_azimuth, solar_zenith,
-                              solar_azimuth, gcr, max_zenith=87):
+                              solar_azimuth, gcr, max_zenith=87, tan_phi=None):
     r"""
     Calculate the fraction of the ground with incident direct irradiance.
 
@@ -69,6 +69,10 @@ def _unshaded_ground_fraction(surface_tilt, surface_azimuth, solar_zenith,
     max_zenith : numeric, default 87
         Maximum zenith angle. For solar_zenith > max_zenith, unshaded ground
         fraction is set to 0. [degree]
+    tan_phi : numeric, optional
+        Tangent of the projected solar zenith angle, see
+        :py:func:`_solar_projection_tangent`. Calculated if not provided.
+        [unitless]
 
     Returns
     -------
@@ -83,8 +87,9 @@ def _unshaded_ground_fraction(surface_tilt, surface_azimuth, solar_zenith,
        Photovoltaic Specialists Conference (PVSC), 2019, pp. 1282-1287.
        :doi:`10.1109/PVSC40753.2019.8980572`.
     """
-    tan_phi = _solar_projection_tangent(solar_zenith, solar_azimuth,
-                                        surface_azimuth)
+    if tan_phi is None:
+        tan_phi = _solar_projection_tangent(solar_zenith, solar_azimuth,
+                                            surface_azimuth)
     f_gnd_beam = 1.0 - np.minimum(
         1.0, gcr * np.abs(cosd(surface_tilt) + sind(surface_tilt) * tan_phi))
     np.where(solar_zenith > max_zenith, 0., f_gnd_beam)  # [1], Eq. 4
@@ -126,7 +131,7 @@ def vf_ground_sky_2d(rotation, gcr, x, pitch, height, max_rows=10):
         Shape is (len(x), len(rotation)). [unitless]
     """
     # This function creates large float64 arrays of size
-    # (2*len(x)*len(rotation)*len(max_rows)) or ~100 MB for
+    # (3*len(x)*len(rotation)*len(max_rows)) or ~150 MB for
     # typical time series inputs.  This function makes heavy
     # use of numpy's out parameter to avoid allocating new
     # memory.  Unfortunately that comes at the cost of some
@@ -155,13 +160,17 @@ def vf_ground_sky_2d(rotation, gcr, x, pitch, height, max_rows=10):
     np.subtract(distance_to_row_centers, dx, out=phi[1])
     np.arctan2(a2, phi[1], out=phi[1])
 
-    # swap angles so that phi[0,:,:,:] is the lesser angle
-    phi.sort(axis=0)
+    # order the angles so that phi_min holds the lesser and phi[1] the
+    # greater angle. Element-wise minimum and maximum are much faster than
+    # sorting along the short first axis of phi, at the cost of one more
+    # array the size of phi[0].
+    phi_min = np.minimum(phi[0], phi[1])
+    np.maximum(phi[0], phi[1], out=phi[1])
 
     # now re-use phi's memory again, this time storing cos(phi).
     next_edge = phi[1, :, :, 1:]
     np.cos(next_edge, out=next_edge)
-    prev_edge = phi[0, :, :, :-1]
+    prev_edge = phi_min[:, :, :-1]
     np.cos(prev_edge, out=prev_edge)
     # right edge of next row - left edge of previous row, again
     # reusing memory so that the difference is stored in next_edge.
@@ -212,7 +221,11 @@ def vf_ground_sky_2d_integ(surface_tilt, gcr, height, pitch, max_rows=10,
     # 3) _vf_ground_sky_2d considers [-max_rows, +max_rows]
     # The VFs to the sky will thus be symmetric around z=0.5
     z = np.linspace(0, 1, npoints)
-    rotation = np.atleast_1d(surface_tilt)
+    # many timestamps usually share a tilt (fixed tilt, trackers at their
+    # rotation limits or stowed at night), so only evaluate the view factor
+    # once for each unique tilt
+    rotation, inverse = np.unique(np.atleast_1d(surface_tilt),
+                                  return_inverse=True)
     if vectorize:
         fz_sky = vf_ground_sky_2d(rotation, gcr, z, pitch, height, max_rows)
     else:
@@ -221,20 +234,20 @@ def vf_ground_sky_2d_integ(surface_tilt, gcr, height, pitch, max_rows=10,
             vf = vf_ground_sky_2d(r, gcr, z, pitch, height, max_rows)
             fz_sky[:, k] = vf[:, 0]  # remove spurious rotation dimension
     # calculate the integrated view factor for all of the ground between rows
-    return trapezoid(fz_sky, z, axis=0)
+    return trapezoid(fz_sky, z, axis=0)[inverse.ravel()]
 
 
-def _vf_poly(surface_tilt, gcr, x, delta):
+def _vf_poly(inv_gcr, cos_tilt, x, delta):
     r'''
     A term common to many 2D view factor calculations
 
     Parameters
     ----------
-    surface_tilt : numeric
-        Surface tilt angle in degrees from horizontal, e.g., surface facing up
-        = 0, surface facing horizon = 90. [degree]
-    gcr : numeric
-        Ratio of the row slant length to the row spacing (pitch). [unitless]
+    inv_gcr : numeric
+        Inverse of the ratio of the row slant length to the row spacing
+        (pitch), i.e. ``1 / gcr``. [unitless]
+    cos_tilt : numeric
+        Cosine of the surface tilt angle. [unitless]
     x : numeric
         Position on the row's slant length, as a fraction of the slant length.
         x=0 corresponds to the bottom of the row. [unitless]
@@ -245,8 +258,8 @@ def _vf_poly(surface_tilt, gcr, x, delta):
     -------
     numeric
     '''
-    a = 1 / gcr
-    c = cosd(surface_tilt)
+    a = inv_gcr
+    c = cos_tilt
     return np.sqrt(a*a + 2*delta*a*c*x + x*x)
 
 
@@ -275,8 +288,13 @@ def vf_row_sky_2d(surface_tilt, gcr, x):
         Fraction of the sky dome visible from the point x. [unitless]
 
     '''
-    p = _vf_poly(surface_tilt, gcr, 1 - x, -1)
-    return 0.5*(1 + (1/gcr * cosd(surface_tilt) - (1 - x)) / p)
+    return _vf_row_sky_2d(1 / gcr, cosd(surface_tilt), x)
+
+
+def _vf_row_sky_2d(inv_gcr, cos_tilt, x):
+    # vf_row_sky_2d, for 1/gcr and cos(surface_tilt) calculated by the caller
+    p = _vf_poly(inv_gcr, cos_tilt, 1 - x, -1)
+    return 0.5*(1 + (inv_gcr * cos_tilt - (1 - x)) / p)
 
 
 def vf_row_sky_2d_integ(surface_tilt, gcr, x0=0, x1=1):
@@ -311,11 +329,14 @@ def vf_row_sky_2d_integ(surface_tilt, gcr, x0=0, x1=1):
 
     '''
     u = np.abs(x1 - x0)
-    p0 = _vf_poly(surface_tilt, gcr, 1 - x0, -1)
-    p1 = _vf_poly(surface_tilt, gcr, 1 - x1, -1)
+    # calculate the cosine and 1/gcr once for all terms
+    inv_gcr = 1 / gcr
+    cos_tilt = cosd(surface_tilt)
+    p0 = _vf_poly(inv_gcr, cos_tilt, 1 - x0, -1)
+    p1 = _vf_poly(inv_gcr, cos_tilt, 1 - x1, -1)
     with np.errstate(divide='ignore'):
         result = np.where(u < 1e-6,
-                          vf_row_sky_2d(surface_tilt, gcr, x0),
+                          _vf_row_sky_2d(inv_gcr, cos_tilt, x0),
                           0.5*(1 + 1/u * (p1 - p0))
                           )
     return result
@@ -346,8 +367,14 @@ def vf_row_ground_2d(surface_tilt, gcr, x):
         View factor to the visible ground from the point x. [unitless]
 
     '''
-    p = _vf_poly(surface_tilt, gcr, x, 1)
-    return 0.5 * (1 - (1/gcr * cosd(surface_tilt) + x)/p)
+    return _vf_row_ground_2d(1 / gcr, cosd(surface_tilt), x)
+
+
+def _vf_row_ground_2d(inv_gcr, cos_tilt, x):
+    # vf_row_ground_2d, for 1/gcr and cos(surface_tilt) calculated by the
+    # caller
+    p = _vf_poly(inv_gcr, cos_tilt, x, 1)
+    return 0.5 * (1 - (inv_gcr * cos_tilt + x)/p)
 
 
 def vf_row_ground_2d_integ(surface_tilt, gcr, x0=0, x1=1):
@@ -382,11 +409,14 @@ def vf_row_ground_2d_integ(surface_tilt, gcr, x0=0, x1=1):
 
     '''
     u = np.abs(x1 - x0)
-    p0 = _vf_poly(surface_tilt, gcr, x0, 1)
-    p1 = _vf_poly(surface_tilt, gcr, x1, 1)
+    # calculate the cosine and 1/gcr once for all terms
+    inv_gcr = 1 / gcr
+    cos_tilt = cosd(surface_tilt)
+    p0 = _vf_poly(inv_gcr, cos_tilt, x0, 1)
+    p1 = _vf_poly(inv_gcr, cos_tilt, x1, 1)
     with np.errstate(divide='ignore'):
         result = np.where(u < 1e-6,
-                          vf_row_ground_2d(surface_tilt, gcr, x0),
+                          _vf_row_ground_2d(inv_gcr, cos_tilt, x0),
                           0.5*(1 - 1/u * (p1 - p0))
                           )
     return result
@@ -125,8 +125,9 @@ def ineichen(apparent_zenith, airmass_absolute, linke_turbidity,
     bnci = dni_extra * np.fmax(bnci, 0)
 
     # "empirical correction" SE 73, 157 & SE 73, 312.
-    bnci_2 = ((1 - (0.1 - 0.2*np.exp(-tl))/(0.1 + 0.882/fh1)) /
-              cos_zenith)
+    with np.errstate(divide='ignore'):
+        bnci_2 = ((1 - (0.1 - 0.2*np.exp(-tl))/(0.1 + 0.882/fh1)) /
+                  cos_zenith)
     bnci_2 = ghi * np.fmin(np.fmax(bnci_2, 0), 1e20)
 
     dni = np.minimum(bnci, bnci_2)
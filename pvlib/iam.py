@@ -218,6 +218,9 @@ def physical(aoi, n=1.526, K=4.0, L=0.002, *, n_ar=None):
         tau_p *= np.exp(-K * L / costheta)
 
     tau_0 *= np.exp(-K * L)
+    # tau_0 doesn't depend on aoi, so don't let it change the precision of
+    # the result, e.g. for float32 aoi
+    tau_0 = np.asarray(tau_0, dtype=tau_s.dtype)
 
     # incidence angle modifier
     iam = (tau_s + tau_p) / 2 / tau_0
@@ -302,6 +305,10 @@ def martin_ruiz(aoi, a_r=0.16):
     if np.any(np.less_equal(a_r, 0)):
         raise ValueError("The parameter 'a_r' cannot be zero or negative.")
 
+    if a_r.ndim == 0:
+        # don't let a scalar a_r change the precision of aoi, e.g. float32
+        a_r = a_r.astype(np.result_type(aoi, 1.0))
+
     with np.errstate(invalid='ignore'):
         iam = (1 - np.exp(-cosd(aoi) / a_r)) / (1 - np.exp(-1 / a_r))
         iam = np.where(np.abs(aoi) >= 90.0, 0.0, iam)
@@ -970,10 +977,10 @@ def _sin_weight(aoi):
     return 1 - sind(aoi)
 
 
-def _residual(aoi, source_iam, target, target_params,
-              weight=_sin_weight):
-    # computes a sum of weighted differences between the source model
-    # and target model, using the provided weight function
+def _residual_weights(aoi, weight=_sin_weight):
+    # evaluates the weight function for the residual. the weights only
+    # depend on aoi, so they are computed once per fit rather than once
+    # per evaluation of the residual by the optimizer
 
     weights = weight(aoi)
 
@@ -982,12 +989,25 @@ def _residual(aoi, source_iam, target, target_params,
     # of (0, 90) to affect the fit; this is a possible issue when using
     # `iam.fit`, but not an issue when using `iam.convert`, since in
     # that case aoi is defined internally)
-    weights = weights * np.logical_and(aoi >= 0, aoi <= 90).astype(int)
+    return weights * np.logical_and(aoi >= 0, aoi <= 90).astype(int)
+
 
+def _weighted_residual(aoi, source_iam, target, target_params, weights):
+    # computes a sum of weighted differences between the source model
+    # and target model, using weights from _residual_weights
     diff = np.abs(source_iam - np.nan_to_num(target(aoi, *target_params)))
     return np.sum(diff * weights)
 
 
+def _residual(aoi, source_iam, target, target_params,
+              weight=_sin_weight):
+    # computes a sum of weighted differences between the source model
+    # and target model, using the provided weight function
+    weights = _residual_weights(aoi, weight)
+    return _weighted_residual(aoi, source_iam, target, target_params,
+                              weights)
+
+
 def _get_ashrae_intercept(b):
     # find x-intercept of ashrae model
     return acosd(b / (1 + b))
@@ -1018,9 +1038,12 @@ def _ashrae_to_physical(aoi, ashrae_iam, weight, fix_n, b):
         bounds = [(1e-6, 0.08), (0.8, 2)]  # L, n
         guess = [0.002, 1.0]
 
+    weights = _residual_weights(aoi, weight)
+
     def residual_function(target_params):
         L, n = target_params
-        return _residual(aoi, ashrae_iam, physical, [n, 4, L], weight)
+        return _weighted_residual(aoi, ashrae_iam, physical, [n, 4, L],
+                                  weights)
 
     return residual_function, guess, bounds
 
@@ -1038,6 +1061,8 @@ def _martin_ruiz_to_physical(aoi, martin_ruiz_iam, weight, a_r):
         bounds.reverse()
         guess.reverse()
 
+    weights = _residual_weights(aoi, weight)
+
     # the product of K and L is more important in determining an initial
     # guess for the location of the minimum, so we pass L in first
     def residual_function(target_params):
@@ -1047,7 +1072,8 @@ def _martin_ruiz_to_physical(aoi, martin_ruiz_iam, weight, a_r):
             L, n = target_params
         else:
             n, L = target_params
-        return _residual(aoi, martin_ruiz_iam, physical, [n, 4, L], weight)
+        return _weighted_residual(aoi, martin_ruiz_iam, physical, [n, 4, L],
+                                  weights)
 
     return residual_function, guess, bounds
 
@@ -1203,9 +1229,11 @@ def convert(source_name, source_params, target_name, weight=_sin_weight,
         # does fine without any special set-up
         bounds = [(1e-04, 1)]
         guess = [1e-03]
+        weights = _residual_weights(aoi, weight)
 
         def residual_function(target_param):
-            return _residual(aoi, source_iam, target, target_param, weight)
+            return _weighted_residual(aoi, source_iam, target, target_param,
+                                      weights)
 
     optimize_result = _minimize(residual_function, guess, bounds,
                                 xtol=xtol)
@@ -1278,6 +1306,7 @@ def fit(measured_aoi, measured_iam, model_name, weight=_sin_weight, xtol=None):
     pvlib.iam.physical
     """
     target = _get_model(model_name)
+    weights = _residual_weights(measured_aoi, weight)
 
     if model_name == "physical":
         bounds = [(0, 0.08), (1, 2)]
@@ -1285,8 +1314,8 @@ def fit(measured_aoi, measured_iam, model_name, weight=_sin_weight, xtol=None):
 
         def residual_function(target_params):
             L, n = target_params
-            return _residual(measured_aoi, measured_iam, target, [n, 4, L],
-                             weight)
+            return _weighted_residual(measured_aoi, measured_iam, target,
+                                      [n, 4, L], weights)
 
     # otherwise, target_name is martin_ruiz or ashrae
     else:
@@ -1294,8 +1323,8 @@ def fit(measured_aoi, measured_iam, model_name, weight=_sin_weight, xtol=None):
         guess = [0.05]
 
         def residual_function(target_param):
-            return _residual(measured_aoi, measured_iam, target,
-                             target_param, weight)
+            return _weighted_residual(measured_aoi, measured_iam, target,
+                                      target_param, weights)
 
     optimize_result = _minimize(residual_function, guess, bounds, xtol)
 
@@ -0,0 +1,36 @@
+"""Helpers shared by the functions in pvlib.iotools."""
+
+import threading
+
+import pandas as pd
+import requests
+
+_LOCAL = threading.local()
+
+
+def _get_session():
+    """
+    Return a ``requests.Session`` that reuses connections between requests.
+
+    Sessions are not safe to share between threads, so each thread gets its
+    own.
+    """
+    try:
+        return _LOCAL.session
+    except AttributeError:
+        _LOCAL.session = requests.Session()
+        return _LOCAL.session
+
+
+def _datetime_index(year, month, day, hour=0, minute=0):
+    """
+    Build a DatetimeIndex from integer date and time columns.
+
+    The dates are parsed as integers YYYYmmdd and the time of day is added,
+    which is much faster than parsing zero-padded date and time strings or
+    assembling the datetimes from all of the columns.
+    """
+    dates = year * 10000 + month * 100 + day
+    return pd.DatetimeIndex(
+        pd.to_datetime(dates, format='%Y%m%d')
+        + pd.to_timedelta(hour * 60 + minute, unit='min'))
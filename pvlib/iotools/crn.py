@@ -135,6 +135,7 @@ def read_crn(filename, map_variables=True):
     data = data.set_index(dtindex)
 
     if map_variables:
-        data = data.rename(columns=VARIABLE_MAP)
+        # rename in place, without copying the data
+        data.columns = [VARIABLE_MAP.get(col, col) for col in data.columns]
 
     return data
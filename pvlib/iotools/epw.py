@@ -5,6 +5,7 @@ Import functions for EPW data files.
 import io
 from urllib.request import urlopen, Request
 import pandas as pd
+from pvlib.iotools._utils import _datetime_index
 
 
 def read_epw(filename, coerce_year=None):
@@ -302,11 +303,9 @@ def parse_epw(csvdata, coerce_year=None):
         data["year"] = coerce_year
 
     # create index that supplies correct date and time zone information
-    dts = data[['month', 'day']].astype(str).apply(lambda x: x.str.zfill(2))
-    hrs = (data['hour'] - 1).astype(str).str.zfill(2)
-    dtscat = data['year'].astype(str) + dts['month'] + dts['day'] + hrs
-    idx = pd.to_datetime(dtscat, format='%Y%m%d%H')
-    idx = idx.dt.tz_localize(int(meta['TZ'] * 3600))
-    data.index = idx
+    # (EPW hours run from 1 to 24, i.e. hour 1 starts at 00:00)
+    idx = _datetime_index(data['year'], data['month'], data['day'],
+                          hour=data['hour'] - 1)
+    data.index = idx.tz_localize(int(meta['TZ'] * 3600))
 
     return data, meta
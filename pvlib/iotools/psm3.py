@@ -3,12 +3,20 @@ Get PSM3 TMY
 see https://developer.nrel.gov/docs/solar/nsrdb/psm3_data_download/
 """
 
+import csv
+import gzip
+import hashlib
 import io
+import os
+from pathlib import Path
+import shutil
+import tempfile
 import requests
 import pandas as pd
 from json import JSONDecodeError
 import warnings
 from pvlib._deprecation import pvlibDeprecationWarning
+from pvlib.iotools._utils import _datetime_index, _get_session
 
 NSRDB_API_BASE = "https://developer.nrel.gov"
 PSM_URL = NSRDB_API_BASE + "/api/nsrdb/v2/solar/psm3-2-2-download.csv"
@@ -60,11 +68,23 @@ REQUEST_VARIABLE_MAP = {
     'precipitable_water': 'total_precipitable_water',
 }
 
+# request parameters that identify the requester rather than the data
+_REQUESTER_PARAMS = ('api_key', 'full_name', 'email', 'affiliation')
+
+# types of the numeric metadata fields, the rest are left as strings
+_METADATA_TYPES = {
+    'Local Time Zone': int,
+    'Time Zone': int,
+    'Latitude': float,
+    'Longitude': float,
+    'Elevation': int,
+}
+
 
 def get_psm3(latitude, longitude, api_key, email, names='tmy', interval=60,
              attributes=ATTRIBUTES, leap_day=True, full_name=PVLIB_PYTHON,
              affiliation=PVLIB_PYTHON, map_variables=True, url=None,
-             timeout=30):
+             timeout=30, cache_dir=None):
     """
     Retrieve NSRDB PSM3 timeseries weather data from the PSM3 API. The NSRDB
     is described in [1]_ and the PSM3 API is described in [2]_, [3]_, and [4]_.
@@ -120,6 +140,11 @@ def get_psm3(latitude, longitude, api_key, email, names='tmy', interval=60,
         the ``names`` and ``interval`` parameters.
     timeout : int, default 30
         time in seconds to wait for server response before timeout
+    cache_dir : str or path-like, optional
+        Directory in which to keep a compressed copy of each response. If a
+        copy for the same request already exists there, it is read instead
+        of contacting the API. Cached files are never refreshed; delete them
+        to download the data again. If not specified, nothing is cached.
 
     Returns
     -------
@@ -204,19 +229,61 @@ def get_psm3(latitude, longitude, api_key, email, names='tmy', interval=60,
         else:
             url = PSM_URL
 
-    response = requests.get(url, params=params, timeout=timeout)
+    if cache_dir is not None:
+        # the requester's details don't change the data, so leave them out
+        # of the name of the cached file
+        request = sorted((key, value) for key, value in params.items()
+                         if key not in _REQUESTER_PARAMS)
+        digest = hashlib.sha1(repr((url, request)).encode()).hexdigest()
+        cache_file = Path(cache_dir) / f'psm3_{digest}.csv.gz'
+        if not cache_file.exists():
+            _download_psm3(url, params, timeout, cache_file)
+        with gzip.open(cache_file, 'rt', encoding='utf-8',
+                       newline='\n') as fbuf:
+            return parse_psm3(fbuf, map_variables)
+
+    with _request_psm3(url, params, timeout) as response:
+        # the CSV is streamed as a UTF-8 bytestring, so decode it as it is
+        # read instead of holding both the bytes and the decoded text in
+        # memory; only split lines on '\n' like io.StringIO does
+        fbuf = io.TextIOWrapper(response.raw, encoding='utf-8', newline='\n')
+        return parse_psm3(fbuf, map_variables)
+
+
+def _request_psm3(url, params, timeout):
+    """Send a PSM3 request and return the streamed, successful response."""
+    response = _get_session().get(url, params=params, timeout=timeout,
+                                  stream=True)
     if not response.ok:
         # if the API key is rejected, then the response status will be 403
         # Forbidden, and then the error is in the content and there is no JSON
-        try:
-            errors = response.json()['errors']
-        except JSONDecodeError:
-            errors = response.content.decode('utf-8')
+        with response:
+            try:
+                errors = response.json()['errors']
+            except JSONDecodeError:
+                errors = response.content.decode('utf-8')
         raise requests.HTTPError(errors, response=response)
-    # the CSV is in the response content as a UTF-8 bytestring
-    # to use pandas we need to create a file buffer from the response
-    fbuf = io.StringIO(response.content.decode('utf-8'))
-    return parse_psm3(fbuf, map_variables)
+    response.raw.decode_content = True
+    # keep the stream open once exhausted so a wrapper can detect EOF
+    response.raw.auto_close = False
+    return response
+
+
+def _download_psm3(url, params, timeout, cache_file):
+    """Save a gzip-compressed PSM3 response to ``cache_file``."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first, so an interrupted download doesn't
+    # leave a partial file in the cache
+    fd, tmp_file = tempfile.mkstemp(suffix='.tmp', dir=cache_file.parent)
+    os.close(fd)
+    try:
+        with _request_psm3(url, params, timeout) as response, \
+                gzip.open(tmp_file, 'wb') as f:
+            shutil.copyfileobj(response.raw, f)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
 
 
 def parse_psm3(fbuf, map_variables=True):
@@ -317,20 +384,15 @@ def parse_psm3(fbuf, map_variables=True):
        <https://web.archive.org/web/20170207203107/https://sam.nrel.gov/sites/default/files/content/documents/pdf/wfcsv.pdf>`_
     """
     # The first 2 lines of the response are headers with metadata
-    metadata_fields = fbuf.readline().split(',')
-    metadata_fields[-1] = metadata_fields[-1].strip()  # strip trailing newline
-    metadata_values = fbuf.readline().split(',')
-    metadata_values[-1] = metadata_values[-1].strip()  # strip trailing newline
+    header = csv.reader(fbuf)
+    metadata_fields = next(header)
+    metadata_values = next(header)
     metadata = dict(zip(metadata_fields, metadata_values))
     # the response is all strings, so set some metadata types to numbers
-    metadata['Local Time Zone'] = int(metadata['Local Time Zone'])
-    metadata['Time Zone'] = int(metadata['Time Zone'])
-    metadata['Latitude'] = float(metadata['Latitude'])
-    metadata['Longitude'] = float(metadata['Longitude'])
-    metadata['Elevation'] = int(metadata['Elevation'])
+    for field, dtype in _METADATA_TYPES.items():
+        metadata[field] = dtype(metadata[field])
     # get the column names so we can set the dtypes
-    columns = fbuf.readline().split(',')
-    columns[-1] = columns[-1].strip()  # strip trailing newline
+    columns = next(header)
     # Since the header has so many columns, excel saves blank cols in the
     # data below the header lines.
     columns = [col for col in columns if col != '']
@@ -342,14 +404,14 @@ def parse_psm3(fbuf, map_variables=True):
         fbuf, header=None, names=columns, usecols=columns, dtype=dtypes,
         delimiter=',', lineterminator='\n')  # skip carriage returns \r
     # the response 1st 5 columns are a date vector, convert to datetime
-    dtidx = pd.to_datetime(
-        data[['Year', 'Month', 'Day', 'Hour', 'Minute']])
+    dtidx = _datetime_index(data['Year'], data['Month'], data['Day'],
+                            hour=data['Hour'], minute=data['Minute'])
     # in USA all timezones are integers
     tz = 'Etc/GMT%+d' % -metadata['Time Zone']
-    data.index = pd.DatetimeIndex(dtidx).tz_localize(tz)
+    data.index = dtidx.tz_localize(tz)
 
     if map_variables:
-        data = data.rename(columns=VARIABLE_MAP)
+        data.columns = [VARIABLE_MAP.get(col, col) for col in data.columns]
         metadata['latitude'] = metadata.pop('Latitude')
         metadata['longitude'] = metadata.pop('Longitude')
         metadata['altitude'] = metadata.pop('Elevation')
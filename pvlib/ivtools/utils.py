@@ -14,6 +14,24 @@ EPS_slope = np.finfo('float').eps**(1/3)
 # A small number used to decide when a slope is equivalent to zero
 EPS_val = np.finfo('float').eps
 
+# For each of the 5 points used by _numdiff, the indices of the other 4
+# points, and the triples and pairs of them whose products are summed in
+# the coefficients of the first and second derivative.
+_NUMDIFF_OTHERS = np.array([
+    [1, 2, 3, 4], [0, 2, 3, 4], [0, 1, 3, 4], [0, 1, 2, 4], [0, 1, 2, 3]])
+_NUMDIFF_TRIPLES = np.array([
+    [[1, 2, 3], [1, 2, 4], [1, 3, 4], [2, 3, 4]],
+    [[0, 2, 3], [0, 2, 4], [0, 3, 4], [2, 3, 4]],
+    [[0, 1, 3], [0, 1, 4], [0, 3, 4], [1, 3, 4]],
+    [[0, 1, 2], [0, 1, 4], [0, 2, 4], [1, 2, 4]],
+    [[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]]])
+_NUMDIFF_PAIRS = np.array([
+    [[1, 2], [1, 3], [1, 4], [2, 3], [2, 4], [3, 4]],
+    [[0, 2], [0, 3], [0, 4], [2, 3], [2, 4], [3, 4]],
+    [[0, 1], [0, 3], [0, 4], [1, 3], [1, 4], [3, 4]],
+    [[0, 1], [0, 2], [0, 4], [1, 2], [1, 4], [2, 4]],
+    [[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]])
+
 
 def _numdiff(x, f):
     """
@@ -66,64 +84,38 @@ def _numdiff(x, f):
     df[-2:] = float("Nan")
     df2[-2:] = float("Nan")
 
+    x = np.asarray(x)
+    f = np.asarray(f)
+
+    # equally spaced points reduce to the usual centered difference formulas.
+    # The spacing of x is uniform up to the rounding of x itself
+    dx = np.diff(x)
+    if dx.size and dx[0] != 0 and np.allclose(
+            dx, dx[0], rtol=1e-12,
+            atol=4 * np.finfo(float).eps * max(abs(x[0]), abs(x[-1]))):
+        h = dx[0]
+        df[2:-2] = (f[:-4] - 8. * f[1:-3] + 8. * f[3:-1] - f[4:]) / (12. * h)
+        df2[2:-2] = (-f[:-4] + 16. * f[1:-3] - 30. * f[2:-2] + 16. * f[3:-1]
+                     - f[4:]) / (12. * h**2)
+        return df, df2
+
     # Rest of points. Take reference point to be the middle of each group of 5
     # points. Calculate displacements
     ff = np.vstack((f[:-4], f[1:-3], f[2:-2], f[3:-1], f[4:])).T
 
     a0 = (np.vstack((x[:-4], x[1:-3], x[2:-2], x[3:-1], x[4:])).T
-          - np.tile(x[2:-2], [5, 1]).T)
-
-    u1 = np.zeros(a0.shape)
-    left = np.zeros(a0.shape)
-    u2 = np.zeros(a0.shape)
-
-    u1[:, 0] = (
-        a0[:, 1] * a0[:, 2] * a0[:, 3] + a0[:, 1] * a0[:, 2] * a0[:, 4]
-        + a0[:, 1] * a0[:, 3] * a0[:, 4] + a0[:, 2] * a0[:, 3] * a0[:, 4])
-    u1[:, 1] = (
-        a0[:, 0] * a0[:, 2] * a0[:, 3] + a0[:, 0] * a0[:, 2] * a0[:, 4]
-        + a0[:, 0] * a0[:, 3] * a0[:, 4] + a0[:, 2] * a0[:, 3] * a0[:, 4])
-    u1[:, 2] = (
-        a0[:, 0] * a0[:, 1] * a0[:, 3] + a0[:, 0] * a0[:, 1] * a0[:, 4]
-        + a0[:, 0] * a0[:, 3] * a0[:, 4] + a0[:, 1] * a0[:, 3] * a0[:, 4])
-    u1[:, 3] = (
-        a0[:, 0] * a0[:, 1] * a0[:, 2] + a0[:, 0] * a0[:, 1] * a0[:, 4]
-        + a0[:, 0] * a0[:, 2] * a0[:, 4] + a0[:, 1] * a0[:, 2] * a0[:, 4])
-    u1[:, 4] = (
-        a0[:, 0] * a0[:, 1] * a0[:, 2] + a0[:, 0] * a0[:, 1] * a0[:, 3]
-        + a0[:, 0] * a0[:, 2] * a0[:, 3] + a0[:, 1] * a0[:, 2] * a0[:, 3])
-
-    left[:, 0] = (a0[:, 0] - a0[:, 1]) * (a0[:, 0] - a0[:, 2]) * \
-        (a0[:, 0] - a0[:, 3]) * (a0[:, 0] - a0[:, 4])
-    left[:, 1] = (a0[:, 1] - a0[:, 0]) * (a0[:, 1] - a0[:, 2]) * \
-        (a0[:, 1] - a0[:, 3]) * (a0[:, 1] - a0[:, 4])
-    left[:, 2] = (a0[:, 2] - a0[:, 0]) * (a0[:, 2] - a0[:, 1]) * \
-        (a0[:, 2] - a0[:, 3]) * (a0[:, 2] - a0[:, 4])
-    left[:, 3] = (a0[:, 3] - a0[:, 0]) * (a0[:, 3] - a0[:, 1]) * \
-        (a0[:, 3] - a0[:, 2]) * (a0[:, 3] - a0[:, 4])
-    left[:, 4] = (a0[:, 4] - a0[:, 0]) * (a0[:, 4] - a0[:, 1]) * \
-        (a0[:, 4] - a0[:, 2]) * (a0[:, 4] - a0[:, 3])
-
-    df[2:-2] = np.sum(-(u1 / left) * ff, axis=1)
+          - x[2:-2, np.newaxis])
+
+    # each point's coefficients are sums of products of the displacements of
+    # the other 4 points, see the index tables above
+    left = np.prod(a0[:, :, np.newaxis] - a0[:, _NUMDIFF_OTHERS], axis=2)
+    u1 = np.prod(a0[:, _NUMDIFF_TRIPLES], axis=3).sum(axis=2)
+    u2 = np.prod(a0[:, _NUMDIFF_PAIRS], axis=3).sum(axis=2)
+
+    df[2:-2] = np.einsum('ij,ij->i', -u1 / left, ff)
 
     # second derivative
-    u2[:, 0] = (
-        a0[:, 1] * a0[:, 2] + a0[:, 1] * a0[:, 3] + a0[:, 1] * a0[:, 4]
-        + a0[:, 2] * a0[:, 3] + a0[:, 2] * a0[:, 4] + a0[:, 3] * a0[:, 4])
-    u2[:, 1] = (
-        a0[:, 0] * a0[:, 2] + a0[:, 0] * a0[:, 3] + a0[:, 0] * a0[:, 4]
-        + a0[:, 2] * a0[:, 3] + a0[:, 2] * a0[:, 4] + a0[:, 3] * a0[:, 4])
-    u2[:, 2] = (
-        a0[:, 0] * a0[:, 1] + a0[:, 0] * a0[:, 3] + a0[:, 0] * a0[:, 4]
-        + a0[:, 1] * a0[:, 3] + a0[:, 1] * a0[:, 3] + a0[:, 3] * a0[:, 4])
-    u2[:, 3] = (
-        a0[:, 0] * a0[:, 1] + a0[:, 0] * a0[:, 2] + a0[:, 0] * a0[:, 4]
-        + a0[:, 1] * a0[:, 2] + a0[:, 1] * a0[:, 4] + a0[:, 2] * a0[:, 4])
-    u2[:, 4] = (
-        a0[:, 0] * a0[:, 1] + a0[:, 0] * a0[:, 2] + a0[:, 0] * a0[:, 3]
-        + a0[:, 1] * a0[:, 2] + a0[:, 1] * a0[:, 4] + a0[:, 2] * a0[:, 3])
-
-    df2[2:-2] = 2. * np.sum(u2 * ff, axis=1)
+    df2[2:-2] = 2. * np.einsum('ij,ij->i', u2 / left, ff)
     return df, df2
 
 
@@ -158,24 +150,30 @@ def rectify_iv_curve(voltage, current, decimals=None):
       equal to the average of current at duplicated voltages.
     """
 
-    df = pd.DataFrame(data=np.vstack((voltage, current)).T, columns=['v', 'i'])
-    # restrict to first quadrant
-    df.dropna(inplace=True)
-    df = df[(df['v'] >= 0) & (df['i'] >= 0)]
+    voltage = np.asarray(voltage, dtype=float)
+    current = np.asarray(current, dtype=float)
+    # restrict to first quadrant, which also removes NaNs
+    keep = (voltage >= 0) & (current >= 0)
+    voltage = voltage[keep]
+    current = current[keep]
     # sort pairs on voltage, then current
-    df = df.sort_values(by=['v', 'i'], ascending=[True, False])
+    order = np.lexsort((-current, voltage))
+    voltage = voltage[order]
+    current = current[order]
 
     # eliminate duplicate voltage points
     if decimals is not None:
-        df['v'] = np.round(df['v'], decimals=decimals)
+        voltage = np.round(voltage, decimals=decimals)
 
-    _, inv = np.unique(df['v'], return_inverse=True)
-    df.index = inv
-    # average current at each common voltage
-    df = df.groupby(by=inv).mean()
+    # voltage is sorted, so equal voltages form contiguous runs
+    starts = np.flatnonzero(np.diff(voltage, prepend=np.nan) != 0)
+    if starts.size:
+        # average current at each common voltage
+        counts = np.diff(starts, append=len(voltage))
+        current = np.add.reduceat(current, starts) / counts
+        voltage = voltage[starts]
 
-    tmp = np.array(df).T
-    return tmp[0, ], tmp[1, ]
+    return voltage, current
 
 
 def _schumaker_qspline(x, y):
@@ -241,8 +239,12 @@ def _schumaker_qspline(x, y):
 
     s = np.zeros_like(x)
 
-    left = np.append(0.0, delta)
-    right = np.append(delta, 0.0)
+    # slopes of the intervals to the left and right of each point, zero
+    # beyond the ends, as views of a single padded array
+    padded = np.zeros(n + 1)
+    padded[1:-1] = delta
+    left = padded[:-1]
+    right = padded[1:]
 
     pdelta = left * right
 
@@ -289,12 +291,6 @@ def _schumaker_qspline(x, y):
     tmps2 = s[1:]
     diffs = np.diff(s)
 
-    # structure to contain information associated with each knot, used to
-    # calculate coefficients
-    uu = np.zeros((k, 6))
-
-    uu[:(n - 1), :] = np.array([tmpx, tmpx2, tmpy, tmps, tmps2, delta]).T
-
     # [2], Algorithm 4.1 subpart 1 of Step 5
     # original x values that are left points of intervals without internal
     # knots
@@ -318,8 +314,8 @@ def _schumaker_qspline(x, y):
 
     # Since the above two lines can lead to numerical errors, aa and b
     # are rounded to 0.0 is their absolute value is small enough.
-    aa[np.isclose(aa, 0., atol=EPS_val)] = 0.
-    b[np.isclose(b, 0., atol=EPS_val)] = 0.
+    aa[np.abs(aa) <= EPS_val] = 0.
+    b[np.abs(b) <= EPS_val] = 0.
 
     sbar = np.zeros(k)
     eta = np.zeros(k)
@@ -327,102 +323,81 @@ def _schumaker_qspline(x, y):
     # added knot to each inverval's internal knot value
     xi = np.zeros(k)
 
-    t0 = aa * b >= 0
-    # first 'else' in Algorithm 4.1 Step 5
-    v = np.logical_and(~u, t0)  # len(u) == (n - 1) always
-    q = np.sum(v)  # number of this type of knot to add
-
-    if q > 0.:
-        xk[(n - 1):(n + q - 1)] = .5 * (tmpx[v] + tmpx2[v])  # knot location
-        uu[(n - 1):(n + q - 1), :] = np.array([tmpx[v], tmpx2[v], tmpy[v],
-                                               tmps[v], tmps2[v], delta[v]]).T
-        xi[:(n-1)][v] = xk[(n - 1):(n + q - 1)]
-
-    t1 = np.abs(aa) > np.abs(b)
-    w = np.logical_and(~u, ~v)  # second 'else' in Algorithm 4.1 Step 5
-    w = np.logical_and(w, t1)
+    # classify the intervals which get an internal knot by the 'else'
+    # branches in Algorithm 4.1 Step 5
+    v = ~u & (aa * b >= 0)  # first 'else'
+    w = ~u & ~v & (np.abs(aa) > np.abs(b))  # second 'else'
+    z = ~u & ~v & ~w  # last 'else'
+    q = np.sum(v)  # number of knots of each type to add
     r = np.sum(w)
-
-    if r > 0.:
-        xk[(n + q - 1):(n + q + r - 1)] = tmpx2[w] + aa[w] * delx[w] / diffs[w]
-        uu[(n + q - 1):(n + q + r - 1), :] = np.array([tmpx[w], tmpx2[w],
-                                                       tmpy[w], tmps[w],
-                                                       tmps2[w], delta[w]]).T
-        xi[:(n - 1)][w] = xk[(n + q - 1):(n + q + r - 1)]
-
-    z = np.logical_and(~u, ~v)  # last 'else' in Algorithm 4.1 Step 5
-    z = np.logical_and(z, ~w)
     ss = np.sum(z)
 
-    if ss > 0.:
-        xk[(n + q + r - 1):(n + q + r + ss - 1)] = \
-            tmpx[z] + b[z] * delx[z] / diffs[z]
-        uu[(n + q + r - 1):(n + q + r + ss - 1), :] = \
-            np.array([tmpx[z], tmpx2[z], tmpy[z], tmps[z], tmps2[z],
-                      delta[z]]).T
-        xi[:(n-1)][z] = xk[(n + q + r - 1):(n + q + r + ss - 1)]
+    # add the internal knots after the original points, grouped by type
+    inserted = np.concatenate(
+        (np.flatnonzero(v), np.flatnonzero(w), np.flatnonzero(z)))
+    new = slice(n - 1, n + q + r + ss - 1)
+    xk[new] = np.concatenate((
+        .5 * (tmpx[v] + tmpx2[v]),
+        tmpx2[w] + aa[w] * delx[w] / diffs[w],
+        tmpx[z] + b[z] * delx[z] / diffs[z]))
+    xi[inserted] = xk[new]
+    # information about the interval containing each inserted knot, used to
+    # calculate coefficients
+    ux = tmpx[inserted]
+    ux2 = tmpx2[inserted]
+    uy = tmpy[inserted]
+    us = tmps[inserted]
+    us2 = tmps2[inserted]
+    udelta = delta[inserted]
 
     # define polynomial coefficients for intervals with added knots
     ff = ~u
     sbar[:(n-1)][ff] = (
-        (2 * uu[:(n - 1), 5][ff] - uu[:(n-1), 4][ff])
-        + (uu[:(n - 1), 4][ff] - uu[:(n-1), 3][ff])
-        * (xi[:(n - 1)][ff] - uu[:(n-1), 0][ff])
-        / (uu[:(n - 1), 1][ff] - uu[:(n-1), 0][ff]))
+        (2 * delta[ff] - tmps2[ff])
+        + (tmps2[ff] - tmps[ff])
+        * (xi[:(n - 1)][ff] - tmpx[ff])
+        / (tmpx2[ff] - tmpx[ff]))
     eta[:(n-1)][ff] = (
-        (sbar[:(n - 1)][ff] - uu[:(n-1), 3][ff])
-        / (xi[:(n - 1)][ff] - uu[:(n-1), 0][ff]))
-
-    sbar[(n - 1):(n + q + r + ss - 1)] = \
-        (2 * uu[(n - 1):(n + q + r + ss - 1), 5] -
-         uu[(n - 1):(n + q + r + ss - 1), 4]) + \
-        (uu[(n - 1):(n + q + r + ss - 1), 4] -
-         uu[(n - 1):(n + q + r + ss - 1), 3]) * \
-        (xk[(n - 1):(n + q + r + ss - 1)] -
-         uu[(n - 1):(n + q + r + ss - 1), 0]) / \
-        (uu[(n - 1):(n + q + r + ss - 1), 1] -
-         uu[(n - 1):(n + q + r + ss - 1), 0])
-    eta[(n - 1):(n + q + r + ss - 1)] = \
-        (sbar[(n - 1):(n + q + r + ss - 1)] -
-         uu[(n - 1):(n + q + r + ss - 1), 3]) / \
-        (xk[(n - 1):(n + q + r + ss - 1)] -
-         uu[(n - 1):(n + q + r + ss - 1), 0])
+        (sbar[:(n - 1)][ff] - tmps[ff])
+        / (xi[:(n - 1)][ff] - tmpx[ff]))
+
+    # position of each inserted knot in its interval, and interval width
+    ud = xk[new] - ux
+    uwidth = ux2 - ux
+    sbar[new] = (2 * udelta - us2) + (us2 - us) * ud / uwidth
+    eta[new] = (sbar[new] - us) / ud
 
     # constant term for polynomial for intervals with internal knots
-    a[:(n - 1), 2][~u] = uu[:(n - 1), 2][~u]
-    a[:(n - 1), 1][~u] = uu[:(n - 1), 3][~u]
+    a[:(n - 1), 2][~u] = tmpy[~u]
+    a[:(n - 1), 1][~u] = tmps[~u]
     a[:(n - 1), 0][~u] = 0.5 * eta[:(n - 1)][~u]  # leading coefficient
 
-    a[(n - 1):(n + q + r + ss - 1), 2] = \
-        uu[(n - 1):(n + q + r + ss - 1), 2] + \
-        uu[(n - 1):(n + q + r + ss - 1), 3] * \
-        (xk[(n - 1):(n + q + r + ss - 1)] -
-         uu[(n - 1):(n + q + r + ss - 1), 0]) + \
-        .5 * eta[(n - 1):(n + q + r + ss - 1)] * \
-        (xk[(n - 1):(n + q + r + ss - 1)] -
-         uu[(n - 1):(n + q + r + ss - 1), 0]) ** 2.
-    a[(n - 1):(n + q + r + ss - 1), 1] = sbar[(n - 1):(n + q + r + ss - 1)]
-    a[(n - 1):(n + q + r + ss - 1), 0] = \
-        .5 * (uu[(n - 1):(n + q + r + ss - 1), 4] -
-              sbar[(n - 1):(n + q + r + ss - 1)]) / \
-        (uu[(n - 1):(n + q + r + ss - 1), 1] -
-         uu[(n - 1):(n + q + r + ss - 1), 0])
-
-    yk[(n - 1):(n + q + r + ss - 1)] = a[(n - 1):(n + q + r + ss - 1), 2]
+    a[new, 2] = uy + ud * (us + .5 * eta[new] * ud)
+    a[new, 1] = sbar[new]
+    a[new, 0] = .5 * (us2 - sbar[new]) / uwidth
+
+    yk[new] = a[new, 2]
 
     xk[n + q + r + ss - 1] = x[n - 1]
     yk[n + q + r + ss - 1] = y[n - 1]
-    flag[(n - 1):(n + q + r + ss - 1)] = True  # these are all inserted knots
-
-    tmp = np.vstack((xk, a.T, yk, flag)).T
-    # sort output in terms of increasing x (original plus added knots)
-    tmp2 = tmp[tmp[:, 0].argsort(kind='mergesort')]
-
-    t = tmp2[:, 0]
-    outn = len(t)
-    c = tmp2[0:(outn - 1), 1:4]
-    yhat = tmp2[:, 4]
-    kflag = tmp2[:, 5]
+    flag[new] = True  # these are all inserted knots
+
+    # order output in terms of increasing x (original plus added knots).
+    # For increasing x, each inserted knot lies inside its interval, so it
+    # follows the interval's left point, and each original point moves right
+    # by the number of knots inserted before it
+    shift = np.cumsum(~u)
+    order = np.empty(k, dtype=int)
+    order[np.arange(n - 1) + shift - ~u] = np.arange(n - 1)
+    order[inserted + shift[inserted]] = np.arange(n - 1, k - 1)
+    order[-1] = k - 1
+    if not np.all(np.diff(xk[order]) > 0):
+        order = xk.argsort(kind='mergesort')
+
+    t = xk[order]
+    c = a[order[:-1]]
+    yhat = yk[order]
+    kflag = flag[order].astype(float)
     return t, c, yhat, kflag
 
 
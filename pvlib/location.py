@@ -261,9 +261,19 @@ class Location:
                 airmass_absolute = self.get_airmass(
                     times, solar_position=solar_position)['airmass_absolute']
 
-            cs = clearsky.ineichen(apparent_zenith, airmass_absolute,
-                                   linke_turbidity, altitude=self.altitude,
-                                   dni_extra=dni_extra, **kwargs)
+            inputs = [apparent_zenith, airmass_absolute, linke_turbidity,
+                      dni_extra]
+            index = _common_index(*inputs)
+            if index is not None:
+                # the inputs share one index, so skip index alignment in the
+                # model arithmetic and attach the index to the result instead
+                inputs = [x.to_numpy() if isinstance(x, pd.Series) else x
+                          for x in inputs]
+
+            cs = clearsky.ineichen(*inputs[:3], altitude=self.altitude,
+                                   dni_extra=inputs[3], **kwargs)
+            if index is not None:
+                cs = pd.DataFrame(cs, index=index)
         elif model == 'haurwitz':
             cs = clearsky.haurwitz(apparent_zenith)
         elif model == 'simplified_solis':
@@ -454,3 +464,15 @@ def lookup_altitude(latitude, longitude):
     alt *= 28
     alt -= 450
     return alt
+
+
+def _common_index(*args):
+    # returns the index of the first argument if it is a Series and all other
+    # Series arguments have an equal index, else None
+    if not isinstance(args[0], pd.Series):
+        return None
+    index = args[0].index
+    for arg in args[1:]:
+        if isinstance(arg, pd.Series) and not arg.index.equals(index):
+            return None
+    return index
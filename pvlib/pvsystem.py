@@ -2077,14 +2077,14 @@ def retrieve_sam(name=None, path=None):
             "sandiainverter": "sam-library-cec-inverters-2019-03-05.csv",
         }
         try:
-            csvdata_path = Path(__file__).parent.joinpath(
-                "data", internal_dbs[name.lower()]
-            )
+            csvdata_file = internal_dbs[name.lower()]
         except KeyError:
             raise KeyError(
                 f"Invalid name {name}. "
                 + f"Provide one of {list(internal_dbs.keys())}."
             ) from None
+        # copy so that callers can't modify the cached database
+        return _read_internal_sam_db(csvdata_file).copy()
     else:  # path is not None
         if path.lower().startswith("http"):  # URL check is not case-sensitive
             response = urlopen(path)  # URL is case-sensitive
@@ -2094,6 +2094,13 @@ def retrieve_sam(name=None, path=None):
     return _parse_raw_sam_df(csvdata_path)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_internal_sam_db(filename):
+    # the databases shipped with pvlib don't change, so parse each only once
+    csvdata_path = Path(__file__).parent.joinpath("data", filename)
+    return _parse_raw_sam_df(csvdata_path)
+
+
 def _normalize_sam_product_names(names):
     '''
     Replace special characters within the product names to make them more
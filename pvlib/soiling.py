@@ -70,7 +70,7 @@ def hsu(rainfall, cleaning_threshold, surface_tilt, pm2_5, pm10,
     # accumulate rainfall into periods for comparison with threshold
     accum_rain = rainfall.rolling(rain_accum_period, closed='right').sum()
     # cleaning is True for intervals with rainfall greater than threshold
-    cleaning_times = accum_rain.index[accum_rain >= cleaning_threshold]
+    cleaning = (accum_rain >= cleaning_threshold).to_numpy()
 
     # determine the time intervals in seconds (dt_sec)
     dt = rainfall.index
@@ -86,18 +86,25 @@ def hsu(rainfall, cleaning_threshold, surface_tilt, pm2_5, pm10,
     tilted_mass_rate = horiz_mass_rate * cosd(surface_tilt)  # assuming no rain
 
     # tms -> tilt_mass_rate
-    tms_cumsum = np.cumsum(tilted_mass_rate * np.ones(rainfall.shape))
+    tms_cumsum = np.cumsum(tilted_mass_rate)
 
     mass_no_cleaning = pd.Series(index=rainfall.index, data=tms_cumsum)
-    # specify dtype so pandas doesn't assume object
-    mass_removed = pd.Series(index=rainfall.index, dtype='float64')
-    mass_removed.iloc[0] = 0.
-    mass_removed[cleaning_times] = mass_no_cleaning[cleaning_times]
-    accum_mass = mass_no_cleaning - mass_removed.ffill()
+    # mass removed by the most recent cleaning, found by forward filling the
+    # positions of cleaning events; no mass is removed before the first one
+    mass_removed = np.where(cleaning, mass_no_cleaning.to_numpy(), 0.)
+    last_cleaning = np.where(cleaning, np.arange(len(cleaning)), 0)
+    np.maximum.accumulate(last_cleaning, out=last_cleaning)
+    accum_mass = mass_no_cleaning - mass_removed[last_cleaning]
 
-    soiling_ratio = 1 - 0.3437 * erf(0.17 * accum_mass**0.8473)
+    # soiling_ratio = 1 - 0.3437 * erf(0.17 * accum_mass**0.8473), evaluated
+    # in place on a single array
+    soiling_ratio = np.power(accum_mass.to_numpy(), 0.8473)
+    soiling_ratio *= 0.17
+    erf(soiling_ratio, out=soiling_ratio)
+    soiling_ratio *= -0.3437
+    soiling_ratio += 1
 
-    return soiling_ratio
+    return pd.Series(soiling_ratio, index=accum_mass.index)
 
 
 def kimber(rainfall, cleaning_threshold=6, soiling_loss_rate=0.0015,
@@ -186,31 +193,39 @@ def kimber(rainfall, cleaning_threshold=6, soiling_loss_rate=0.0015,
         rain_accum_period, closed='right').sum()
 
     # soiling rate
-    soiling = np.ones_like(rainfall.values) * soiling_loss_rate * day_fraction
+    soiling = np.full(len(rainfall), soiling_loss_rate * day_fraction)
     soiling[0] = initial_soiling
     soiling = np.cumsum(soiling)
-    soiling = pd.Series(soiling, index=rainfall.index, name='soiling')
 
     # rainfall events that clean the panels
-    rain_events = accumulated_rainfall > cleaning_threshold
+    rain_events = (accumulated_rainfall > cleaning_threshold).to_numpy()
 
-    # grace periods windows during which ground is assumed damp, so no soiling
-    grace_windows = rain_events.rolling(grace_period, closed='right').sum() > 0
-
-    # clean panels by subtracting soiling for indices in grace period windows
-    cleaning = pd.Series(float('NaN'), index=rainfall.index)
-    cleaning.iloc[0] = 0.0
-    cleaning[grace_windows] = soiling[grace_windows]
+    # grace periods windows during which ground is assumed damp, so no soiling.
+    # an index is in a window if the most recent rain event, found by forward
+    # filling the positions of rain events, is less than grace_period earlier
+    positions = np.arange(len(rain_events))
+    last_event = np.where(rain_events, positions, -1)
+    np.maximum.accumulate(last_event, out=last_event)
+    since_event = rain_index_vals - rain_index_vals[last_event]
+    cleaned = (last_event >= 0) & (since_event < np.timedelta64(grace_period))
 
     # manual wash dates
     if manual_wash_dates is not None:
         rain_tz = rainfall.index.tz
         # convert manual wash dates to datetime index in the timezone of rain
         manual_wash_dates = pd.DatetimeIndex(manual_wash_dates, tz=rain_tz)
-        cleaning[manual_wash_dates] = soiling[manual_wash_dates]
-
-    # remove soiling by foward filling cleaning where NaN
-    soiling -= cleaning.ffill()
+        missing = ~manual_wash_dates.isin(rainfall.index)
+        if missing.any():
+            raise KeyError(f"{manual_wash_dates[missing]} not in index")
+        cleaned[rainfall.index.isin(manual_wash_dates)] = True
+
+    # clean panels by subtracting soiling at the most recent cleaning, found
+    # the same way as the most recent rain event
+    cleaning = np.where(cleaned, soiling, 0.0)
+    last_cleaned = np.where(cleaned, positions, 0)
+    np.maximum.accumulate(last_cleaned, out=last_cleaned)
+    soiling -= cleaning[last_cleaned]
 
     # check if soiling has reached the maximum
-    return soiling.where(soiling < max_soiling, max_soiling)
+    soiling = np.minimum(soiling, max_soiling)
+    return pd.Series(soiling, index=rainfall.index, name='soiling')
@@ -265,6 +265,17 @@ def _spa_python_import(how):
     return spa
 
 
+def _calculate_deltat(spa, time_utc):
+    # delta_t depends only on the year and month, so evaluate the
+    # polynomials in spa.calculate_deltat once per unique month instead of
+    # once per timestamp and broadcast the result back onto the index
+    year = np.asarray(time_utc.year, dtype=np.int64)
+    month = np.asarray(time_utc.month, dtype=np.int64)
+    months, inverse = np.unique(year * 12 + month - 1, return_inverse=True)
+    delta_t = spa.calculate_deltat(months // 12, months % 12 + 1)
+    return np.asarray(delta_t)[inverse.reshape(-1)]
+
+
 def _datetime_to_unixtime(dtindex):
     # convert a pandas datetime index to unixtime, making sure to handle
     # different pandas units (ns, us, etc) and time zones correctly
@@ -374,7 +385,7 @@ def spa_python(time, latitude, longitude,
 
     if delta_t is None:
         time_utc = tools._pandas_to_utc(time)
-        delta_t = spa.calculate_deltat(time_utc.year, time_utc.month)
+        delta_t = _calculate_deltat(spa, time_utc)
 
     app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
         spa.solar_position(unixtime, lat, lon, elev, pressure, temperature,
@@ -452,7 +463,7 @@ def sun_rise_set_transit_spa(times, latitude, longitude, how='numpy',
     spa = _spa_python_import(how)
 
     if delta_t is None:
-        delta_t = spa.calculate_deltat(times_utc.year, times_utc.month)
+        delta_t = _calculate_deltat(spa, times_utc)
 
     transit, sunrise, sunset = spa.transit_sunrise_sunset(
         unixtime, lat, lon, delta_t, numthreads)
@@ -823,34 +834,40 @@ def ephemeris(time, latitude, longitude, pressure=101325, temperature=12):
 
     SolarTime = (180 + HrAngle) / 15.
 
-    # Calculate refraction correction
+    # Calculate refraction correction. Work on plain arrays rather than
+    # Series so that the piecewise assignments don't align on the index.
     Elevation = SunEl
-    TanEl = pd.Series(np.tan(np.radians(Elevation)), index=time_utc)
-    Refract = pd.Series(0., index=time_utc)
-
-    Refract[(Elevation > 5) & (Elevation <= 85)] = (
-        58.1/TanEl - 0.07/(TanEl**3) + 8.6e-05/(TanEl**5))
-
-    Refract[(Elevation > -0.575) & (Elevation <= 5)] = (
-        Elevation *
-        (-518.2 + Elevation*(103.4 + Elevation*(-12.79 + Elevation*0.711))) +
+    TanEl = np.tan(np.radians(Elevation))
+    Refract = np.zeros_like(Elevation)
+
+    mask = (Elevation > 5) & (Elevation <= 85)
+    Refract[mask] = (
+        58.1/TanEl[mask] - 0.07/(TanEl[mask]**3) + 8.6e-05/(TanEl[mask]**5))
+
+    mask = (Elevation > -0.575) & (Elevation <= 5)
+    Refract[mask] = (
+        Elevation[mask] *
+        (-518.2 + Elevation[mask]*(103.4 + Elevation[mask]*(
+            -12.79 + Elevation[mask]*0.711))) +
         1735)
 
-    Refract[(Elevation > -1) & (Elevation <= -0.575)] = -20.774 / TanEl
+    mask = (Elevation > -1) & (Elevation <= -0.575)
+    Refract[mask] = -20.774 / TanEl[mask]
 
-    Refract *= (283/(273. + temperature)) * (pressure/101325.) / 3600.
+    Refract *= ((283/(273. + np.asarray(temperature))) *
+                (np.asarray(pressure)/101325.) / 3600.)
 
     ApparentSunEl = SunEl + Refract
 
-    # make output DataFrame
-    DFOut = pd.DataFrame(index=time_utc)
-    DFOut['apparent_elevation'] = ApparentSunEl
-    DFOut['elevation'] = SunEl
-    DFOut['azimuth'] = SunAz
-    DFOut['apparent_zenith'] = 90 - ApparentSunEl
-    DFOut['zenith'] = 90 - SunEl
-    DFOut['solar_time'] = SolarTime
-    DFOut.index = time
+    # make output DataFrame in one step from the arrays
+    DFOut = pd.DataFrame({
+        'apparent_elevation': ApparentSunEl,
+        'elevation': SunEl,
+        'azimuth': SunAz,
+        'apparent_zenith': 90 - ApparentSunEl,
+        'zenith': 90 - SunEl,
+        'solar_time': SolarTime,
+    }, index=time)
 
     return DFOut
 
@@ -1002,7 +1019,7 @@ def nrel_earthsun_distance(time, how='numpy', delta_t=67.0, numthreads=4):
 
     if delta_t is None:
         time_utc = tools._pandas_to_utc(time)
-        delta_t = spa.calculate_deltat(time_utc.year, time_utc.month)
+        delta_t = _calculate_deltat(spa, time_utc)
 
     dist = spa.earthsun_distance(unixtime, delta_t, numthreads)
 
@@ -7,7 +7,6 @@ numpy arrays or compiling the code to machine language with numba.
 # Created by Tony Lorenzo (@alorenzo175), Univ. of Arizona, 2015
 
 import os
-import threading
 import warnings
 
 import numpy as np
@@ -21,17 +20,20 @@ def nocompile(*args, **kwargs):
 
 if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
     try:
-        from numba import jit
+        from numba import config, jit, prange
+        from numba import get_num_threads, set_num_threads
     except ImportError:
         warnings.warn('Could not import numba, falling back to numpy ' +
                       'calculation')
         jcompile = nocompile
+        prange = range
         USE_NUMBA = False
     else:
         jcompile = jit
         USE_NUMBA = True
 else:
     jcompile = nocompile
+    prange = range
     USE_NUMBA = False
 
 
@@ -450,16 +452,49 @@ def julian_ephemeris_millennium(julian_ephemeris_century):
     return jme
 
 
-# omit type signature here; specifying read-only arrays requires use of the
-# numba.types API, meaning numba must be available to import.
-# https://github.com/numba/numba/issues/4511
-@jcompile(nopython=True)
-def sum_mult_cos_add_mult(arr, x):
-    # shared calculation used for heliocentric longitude, latitude, and radius
-    s = 0.
-    for row in range(arr.shape[0]):
-        s += arr[row, 0] * np.cos(arr[row, 1] + arr[row, 2] * x)
-    return s
+# number of timestamps evaluated at once by the vectorized numpy kernels.
+# bounds the size of the (series terms, timestamps) intermediate arrays.
+_NUMPY_BLOCKSIZE = 4096
+
+
+def _blockwise(func, x, *args):
+    # apply func to x in blocks of _NUMPY_BLOCKSIZE elements along the
+    # flattened array, keeping the shape of x. returns a scalar if x is one.
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty(x.shape)
+    flat_x = x.reshape(-1)
+    flat_out = out.reshape(-1)
+    for start in range(0, flat_x.size, _NUMPY_BLOCKSIZE):
+        block = slice(start, start + _NUMPY_BLOCKSIZE)
+        flat_out[block] = func(flat_x[block], *args)
+    return out[()]
+
+
+if USE_NUMBA:
+    # omit type signature here; specifying read-only arrays requires use of
+    # the numba.types API, meaning numba must be available to import.
+    # https://github.com/numba/numba/issues/4511
+    @jcompile(nopython=True)
+    def sum_mult_cos_add_mult(arr, x):
+        # shared calculation used for heliocentric longitude, latitude,
+        # and radius
+        s = 0.
+        for row in range(arr.shape[0]):
+            s += arr[row, 0] * np.cos(arr[row, 1] + arr[row, 2] * x)
+        return s
+else:
+    def _sum_mult_cos_add_mult_block(x, arr):
+        # evaluate all rows of the series for all x at once. the inner
+        # product with the amplitudes reduces over the series terms.
+        arg = np.multiply.outer(arr[:, 2], x)
+        arg += arr[:, 1:2]
+        return arr[:, 0] @ np.cos(arg, out=arg)
+
+    def sum_mult_cos_add_mult(arr, x):
+        # shared calculation used for heliocentric longitude, latitude,
+        # and radius
+        return _blockwise(_sum_mult_cos_add_mult_block, x, arr)
+
 
 @jcompile('float64(float64)', nopython=True)
 def heliocentric_longitude(jme):
@@ -470,8 +505,9 @@ def heliocentric_longitude(jme):
     l4 = sum_mult_cos_add_mult(L4, jme)
     l5 = sum_mult_cos_add_mult(L5, jme)
 
-    l_rad = (l0 + l1 * jme + l2 * jme**2 + l3 * jme**3 + l4 * jme**4 +
-             l5 * jme**5)/10**8
+    # polynomial in jme, evaluated with Horner's method
+    l_rad = (l0 + jme * (l1 + jme * (l2 + jme * (l3 + jme * (l4 + jme * l5)))))
+    l_rad = l_rad/10**8
     l = np.rad2deg(l_rad)
     return l % 360
 
@@ -493,7 +529,7 @@ def heliocentric_radius_vector(jme):
     r3 = sum_mult_cos_add_mult(R3, jme)
     r4 = sum_mult_cos_add_mult(R4, jme)
 
-    r = (r0 + r1 * jme + r2 * jme**2 + r3 * jme**3 + r4 * jme**4)/10**8
+    r = (r0 + jme * (r1 + jme * (r2 + jme * (r3 + jme * r4))))/10**8
     return r
 
 
@@ -554,45 +590,77 @@ def moon_ascending_longitude(julian_ephemeris_century):
     return x4
 
 
-@jcompile(
-    'void(float64, float64, float64, float64, float64, float64, float64[:])',
-    nopython=True)
-def longitude_obliquity_nutation(julian_ephemeris_century, x0, x1, x2, x3, x4,
-                                 out):
-    delta_psi_sum = 0.0
-    delta_eps_sum = 0.0
-    for row in range(NUTATION_YTERM_ARRAY.shape[0]):
-        a = NUTATION_ABCD_ARRAY[row, 0]
-        b = NUTATION_ABCD_ARRAY[row, 1]
-        c = NUTATION_ABCD_ARRAY[row, 2]
-        d = NUTATION_ABCD_ARRAY[row, 3]
-        arg = np.radians(
-            NUTATION_YTERM_ARRAY[row, 0]*x0 +
-            NUTATION_YTERM_ARRAY[row, 1]*x1 +
-            NUTATION_YTERM_ARRAY[row, 2]*x2 +
-            NUTATION_YTERM_ARRAY[row, 3]*x3 +
-            NUTATION_YTERM_ARRAY[row, 4]*x4
-        )
-        delta_psi_sum += (a + b * julian_ephemeris_century) * np.sin(arg)
-        delta_eps_sum += (c + d * julian_ephemeris_century) * np.cos(arg)
-    delta_psi = delta_psi_sum*1.0/36000000
-    delta_eps = delta_eps_sum*1.0/36000000
-    # seems like we ought to be able to return a tuple here instead
-    # of resorting to `out`, but returning a UniTuple from this
-    # function caused calculations elsewhere to give the wrong result.
-    # very difficult to investigate since it did not occur when using
-    # object mode.  issue was observed on numba 0.56.4
-    out[0] = delta_psi
-    out[1] = delta_eps
+if USE_NUMBA:
+    @jcompile(
+        'void(float64, float64, float64, float64, float64, float64, '
+        'float64[:])',
+        nopython=True)
+    def longitude_obliquity_nutation(julian_ephemeris_century, x0, x1, x2, x3,
+                                     x4, out):
+        delta_psi_sum = 0.0
+        delta_eps_sum = 0.0
+        for row in range(NUTATION_YTERM_ARRAY.shape[0]):
+            a = NUTATION_ABCD_ARRAY[row, 0]
+            b = NUTATION_ABCD_ARRAY[row, 1]
+            c = NUTATION_ABCD_ARRAY[row, 2]
+            d = NUTATION_ABCD_ARRAY[row, 3]
+            arg = np.radians(
+                NUTATION_YTERM_ARRAY[row, 0]*x0 +
+                NUTATION_YTERM_ARRAY[row, 1]*x1 +
+                NUTATION_YTERM_ARRAY[row, 2]*x2 +
+                NUTATION_YTERM_ARRAY[row, 3]*x3 +
+                NUTATION_YTERM_ARRAY[row, 4]*x4
+            )
+            delta_psi_sum += (a + b * julian_ephemeris_century) * np.sin(arg)
+            delta_eps_sum += (c + d * julian_ephemeris_century) * np.cos(arg)
+        delta_psi = delta_psi_sum*1.0/36000000
+        delta_eps = delta_eps_sum*1.0/36000000
+        # seems like we ought to be able to return a tuple here instead
+        # of resorting to `out`, but returning a UniTuple from this
+        # function caused calculations elsewhere to give the wrong result.
+        # very difficult to investigate since it did not occur when using
+        # object mode.  issue was observed on numba 0.56.4
+        out[0] = delta_psi
+        out[1] = delta_eps
+else:
+    def _nutation_block(x, jce):
+        # x holds the five mean arguments x0 - x4 in its rows
+        arg = np.radians(NUTATION_YTERM_ARRAY) @ x
+        sin_arg = np.sin(arg)
+        cos_arg = np.cos(arg, out=arg)
+        delta_psi = (NUTATION_ABCD_ARRAY[:, 0] @ sin_arg
+                     + jce * (NUTATION_ABCD_ARRAY[:, 1] @ sin_arg))
+        delta_eps = (NUTATION_ABCD_ARRAY[:, 2] @ cos_arg
+                     + jce * (NUTATION_ABCD_ARRAY[:, 3] @ cos_arg))
+        return delta_psi, delta_eps
+
+    def longitude_obliquity_nutation(julian_ephemeris_century, x0, x1, x2, x3,
+                                     x4, out):
+        # evaluate all 63 nutation terms at once by broadcasting the
+        # coefficient tables against the mean arguments
+        jce, x0, x1, x2, x3, x4 = np.broadcast_arrays(
+            julian_ephemeris_century, x0, x1, x2, x3, x4)
+        shape = jce.shape
+        x = np.stack([x0, x1, x2, x3, x4]).reshape(5, -1).astype(np.float64)
+        jce = jce.reshape(-1)
+        delta_psi = np.empty(jce.shape)
+        delta_eps = np.empty(jce.shape)
+        for start in range(0, jce.size, _NUMPY_BLOCKSIZE):
+            block = slice(start, start + _NUMPY_BLOCKSIZE)
+            delta_psi[block], delta_eps[block] = _nutation_block(
+                x[:, block], jce[block])
+        out[0] = delta_psi.reshape(shape) * 1.0 / 36000000
+        out[1] = delta_eps.reshape(shape) * 1.0 / 36000000
 
 
 @jcompile('float64(float64)', nopython=True)
 def mean_ecliptic_obliquity(julian_ephemeris_millennium):
     U = 1.0*julian_ephemeris_millennium/10
-    e0 = (84381.448 - 4680.93 * U - 1.55 * U**2
-          + 1999.25 * U**3 - 51.38 * U**4 - 249.67 * U**5
-          - 39.05 * U**6 + 7.12 * U**7 + 27.87 * U**8
-          + 5.79 * U**9 + 2.45 * U**10)
+    # polynomial in U, evaluated with Horner's method
+    e0 = 2.45
+    for coeff in (5.79, 27.87, 7.12, -39.05, -249.67, -51.38, 1999.25, -1.55,
+                  -4680.93, 84381.448):
+        e0 = coeff + U * e0
     return e0
 
 
@@ -813,11 +881,9 @@ def topocentric_azimuth_angle(topocentric_astronomers_azimuth):
 
 @jcompile('float64(float64)', nopython=True)
 def sun_mean_longitude(julian_ephemeris_millennium):
-    M = (280.4664567 + 360007.6982779 * julian_ephemeris_millennium
-         + 0.03032028 * julian_ephemeris_millennium**2
-         + julian_ephemeris_millennium**3 / 49931
-         - julian_ephemeris_millennium**4 / 15300
-         - julian_ephemeris_millennium**5 / 2000000)
+    jme = julian_ephemeris_millennium
+    M = (280.4664567 + jme * (360007.6982779 + jme * (
+        0.03032028 + jme * (1 / 49931 - jme * (1 / 15300 + jme / 2000000)))))
     return M
 
 
@@ -837,8 +903,10 @@ def equation_of_time(sun_mean_longitude, geocentric_sun_right_ascension,
     return E
 
 
+# parallel=True distributes the prange loop over numba's thread pool;
+# cache=True stores the compiled loop on disk to skip recompilation
 @jcompile('void(float64[:], float64[:], float64[:], float64[:,:])',
-          nopython=True, nogil=True)
+          nopython=True, nogil=True, parallel=True, cache=True)
 def solar_position_loop(unixtime, delta_t, loc_args, out):
     """Loop through the time array and calculate the solar position"""
     lat = loc_args[0]
@@ -850,7 +918,7 @@ def solar_position_loop(unixtime, delta_t, loc_args, out):
     sst = loc_args[6]
     esd = loc_args[7]
 
-    for i in range(unixtime.shape[0]):
+    for i in prange(unixtime.shape[0]):
         utime = unixtime[i]
         dT = delta_t[i]
         jd = julian_day(utime)
@@ -941,28 +1009,15 @@ def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
     if unixtime.dtype != np.float64:
         unixtime = unixtime.astype(np.float64)
 
-    if ulength < numthreads:
-        numthreads = ulength
-
-    if numthreads <= 1:
+    # solar_position_loop runs in parallel on numba's thread pool, which
+    # cannot hold more threads than it was launched with
+    numthreads = max(1, min(numthreads, ulength, config.NUMBA_NUM_THREADS))
+    previous_numthreads = get_num_threads()
+    set_num_threads(numthreads)
+    try:
         solar_position_loop(unixtime, delta_t, loc_args, result)
-        return result
-
-    # split the input and output arrays into numthreads chunks
-    split0 = np.array_split(unixtime, numthreads)
-    split1 = np.array_split(delta_t, numthreads)
-    split2 = np.array_split(result, numthreads, axis=1)
-    chunks = [
-        [a0, a1, loc_args, a2]
-        for a0, a1, a2 in zip(split0, split1, split2)
-    ]
-    # Spawn one thread per chunk
-    threads = [threading.Thread(target=solar_position_loop, args=chunk)
-               for chunk in chunks]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+    finally:
+        set_num_threads(previous_numthreads)
     return result
 
 
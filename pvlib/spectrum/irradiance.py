@@ -8,7 +8,7 @@ from pvlib._deprecation import deprecated
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from functools import partial
+from functools import lru_cache, partial
 from scipy import constants
 from scipy.integrate import trapezoid
 
@@ -75,6 +75,32 @@ def get_am15g(wavelength=None):
     return standard["global"]
 
 
+@lru_cache(maxsize=4)
+def _read_reference_spectra(standard):
+    # parse the data file of a reference standard. the parsed spectra are
+    # cached, since the files are shipped with pvlib and don't change
+    SPECTRA_FILES = {
+        "ASTM G173-03": "ASTMG173.csv",
+    }
+    pvlib_datapath = Path(pvlib.__path__[0]) / "data"
+
+    try:
+        filepath = pvlib_datapath / SPECTRA_FILES[standard]
+    except KeyError:
+        raise ValueError(
+            f"Invalid standard identifier '{standard}'. Available "
+            + "identifiers are: "
+            + ", ".join(SPECTRA_FILES.keys())
+        )
+
+    return pd.read_csv(
+        filepath,
+        header=1,  # expect first line of description, then column names
+        index_col=0,  # first column is "wavelength"
+        dtype=float,
+    )
+
+
 def get_reference_spectra(wavelengths=None, standard="ASTM G173-03"):
     r"""
     Read a standard spectrum specified by ``standard``, optionally
@@ -144,38 +170,22 @@ def get_reference_spectra(wavelengths=None, standard="ASTM G173-03"):
     .. [2] “Reference Air Mass 1.5 Spectra,” www.nrel.gov.
        https://www.nrel.gov/grid/solar-resource/spectra-am1.5.html
     """  # Contributed by Echedey Luis, inspired by Anton Driesse (get_am15g)
-    SPECTRA_FILES = {
-        "ASTM G173-03": "ASTMG173.csv",
-    }
-    pvlib_datapath = Path(pvlib.__path__[0]) / "data"
+    standard = _read_reference_spectra(standard)
 
-    try:
-        filepath = pvlib_datapath / SPECTRA_FILES[standard]
-    except KeyError:
-        raise ValueError(
-            f"Invalid standard identifier '{standard}'. Available "
-            + "identifiers are: "
-            + ", ".join(SPECTRA_FILES.keys())
-        )
+    if wavelengths is None:
+        # copy so that callers can't modify the cached spectra
+        return standard.copy()
 
-    standard = pd.read_csv(
-        filepath,
-        header=1,  # expect first line of description, then column names
-        index_col=0,  # first column is "wavelength"
-        dtype=float,
+    interpolator = partial(
+        np.interp, xp=standard.index, left=0.0, right=0.0
+    )
+    standard = pd.DataFrame(
+        index=wavelengths,
+        data={
+            col: interpolator(x=wavelengths, fp=standard[col])
+            for col in standard.columns
+        },
     )
-
-    if wavelengths is not None:
-        interpolator = partial(
-            np.interp, xp=standard.index, left=0.0, right=0.0
-        )
-        standard = pd.DataFrame(
-            index=wavelengths,
-            data={
-                col: interpolator(x=wavelengths, fp=standard[col])
-                for col in standard.columns
-            },
-        )
 
     return standard
 
@@ -288,9 +288,10 @@ def spectral_factor_firstsolar(precipitable_water, airmass_absolute,
 
     coeff = coefficients
     ama = airmass_absolute
+    sqrt_pw = np.sqrt(pw)
     modifier = (
         coeff[0] + coeff[1]*ama + coeff[2]*pw + coeff[3]*np.sqrt(ama) +
-        coeff[4]*np.sqrt(pw) + coeff[5]*ama/np.sqrt(pw))
+        coeff[4]*sqrt_pw + coeff[5]*ama/sqrt_pw)
 
     return modifier
 
@@ -2,6 +2,7 @@
 test bifical.utils
 """
 import numpy as np
+from numpy.testing import assert_allclose
 import pytest
 from pvlib.bifacial import utils
 from pvlib.shading import masking_angle, ground_angle
@@ -104,6 +105,18 @@ def test_vf_ground_sky_2d_integ(test_system_fixed_tilt, vectorize):
     assert np.isclose(vf_integ, expected_vf_integ, rtol=0.1)
 
 
+@pytest.mark.parametrize('vectorize', [True, False])
+def test_vf_ground_sky_2d_integ_repeated_tilt(vectorize):
+    # repeated tilts, including nan, are evaluated once each
+    surface_tilt = np.array([30., np.nan, -10., 30., np.nan, 30.])
+    vf_integ = utils.vf_ground_sky_2d_integ(
+        surface_tilt, 0.4, 1.5, 5., max_rows=4, vectorize=vectorize)
+    expected = [utils.vf_ground_sky_2d_integ(t, 0.4, 1.5, 5., max_rows=4)[0]
+                for t in surface_tilt]
+    assert vf_integ.shape == surface_tilt.shape
+    assert_allclose(vf_integ, expected)
+
+
 def test_vf_row_sky_2d(test_system_fixed_tilt):
     ts, _, _ = test_system_fixed_tilt
     # with float input, fx at top of row
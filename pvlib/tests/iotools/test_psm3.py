@@ -196,3 +196,44 @@ def test_get_psm3_attribute_mapping(nrel_api_key):
     assert 'latitude' in meta.keys()
     assert 'longitude' in meta.keys()
     assert 'altitude' in meta.keys()
+
+
+def test_get_psm3_streamed(requests_mock):
+    """test get_psm3 parses the streamed response"""
+    with MANUAL_TEST_DATA.open('rb') as f:
+        requests_mock.get(psm3.PSM_URL, content=f.read())
+    expected = pd.read_csv(YEAR_TEST_DATA)
+    data, metadata = psm3.get_psm3(
+        LATITUDE, LONGITUDE, 'key1', PVLIB_EMAIL, names=2017,
+        map_variables=False)
+    assert_psm3_equal(data, metadata, expected)
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs['names'] == ['2017']
+
+
+def test_get_psm3_error_response(requests_mock):
+    """test get_psm3 raises the errors returned by the API"""
+    requests_mock.get(psm3.PSM_URL, status_code=429,
+                      json={'errors': ['too many requests']})
+    with pytest.raises(HTTPError, match='too many requests'):
+        psm3.get_psm3(LATITUDE, LONGITUDE, 'key1', PVLIB_EMAIL, names=2017)
+    assert requests_mock.call_count == 1
+
+
+def test_get_psm3_cache_dir(requests_mock, tmp_path):
+    """test get_psm3 reads repeated requests from cache_dir"""
+    with MANUAL_TEST_DATA.open('rb') as f:
+        requests_mock.get(psm3.PSM_URL, content=f.read())
+    expected = pd.read_csv(YEAR_TEST_DATA)
+    for api_key in ['key1', 'key2']:
+        data, metadata = psm3.get_psm3(
+            LATITUDE, LONGITUDE, api_key, PVLIB_EMAIL, names=2017,
+            map_variables=False, cache_dir=tmp_path)
+        assert_psm3_equal(data, metadata, expected)
+    assert requests_mock.call_count == 1
+    assert len(list(tmp_path.glob('psm3_*.csv.gz'))) == 1
+    # a different request is downloaded again
+    psm3.get_psm3(LATITUDE, LONGITUDE, 'key1', PVLIB_EMAIL, names=2018,
+                  map_variables=False, cache_dir=tmp_path)
+    assert requests_mock.call_count == 2
+    assert len(list(tmp_path.glob('psm3_*.csv.gz'))) == 2
@@ -5,7 +5,8 @@ from numpy import nan
 import pytest
 
 from pvlib.iotools import solrad
-from ..conftest import DATA_DIR, assert_frame_equal, RERUNS, RERUNS_DELAY
+from ..conftest import (DATA_DIR, assert_frame_equal, assert_series_equal,
+                        RERUNS, RERUNS_DELAY)
 
 
 testfile = DATA_DIR / 'abq19056.dat'
@@ -107,6 +108,63 @@ def test_read_solrad(testfile, index, columns, values, dtypes, meta):
     assert m == meta
 
 
+@pytest.mark.parametrize('trim_line', [False, True])
+def test_read_solrad_blank_field(tmp_path, trim_line):
+    # a blank field is NaN, whether or not the lines all have the same length
+    with open(testfile) as f:
+        lines = f.read().splitlines()
+    lines[3] = lines[3][:29] + 6 * ' ' + lines[3][35:]
+    if trim_line:
+        lines[4] = lines[4].rstrip() + ' '
+    filename = tmp_path / 'abq19056.dat'
+    filename.write_text('\n'.join(lines) + '\n')
+    expected, _ = solrad.read_solrad(testfile)
+    expected.iloc[1, 7] = nan
+    out, _ = solrad.read_solrad(filename)
+    assert_frame_equal(out, expected)
+
+
+def test_read_solrad_blank_flag(tmp_path):
+    # a blank flag is NaN, so the flag column is float
+    with open(testfile) as f:
+        lines = f.read().splitlines()
+    lines[3] = lines[3][:43] + 2 * ' ' + lines[3][45:]
+    filename = tmp_path / 'abq19056.dat'
+    filename.write_text('\n'.join(lines) + '\n')
+    out, _ = solrad.read_solrad(filename)
+    assert out['ghi_flag'].dtype == 'float64'
+    assert_series_equal(out['ghi_flag'],
+                        pd.Series([0., nan, 0., 0.], index=index,
+                                  name='ghi_flag'))
+    assert out['year'].dtype == 'int64'
+
+
+def test_read_solrad_truncated_lines(tmp_path):
+    # lines that end before the last columns give NaN for those columns
+    with open(testfile) as f:
+        lines = f.read().splitlines()
+    lines[2:] = [line[:100] for line in lines[2:]]
+    filename = tmp_path / 'abq19056.dat'
+    filename.write_text('\n'.join(lines) + '\n')
+    expected, _ = solrad.read_solrad(testfile)
+    out, _ = solrad.read_solrad(filename)
+    assert_frame_equal(out.iloc[:, :19], expected.iloc[:, :19])
+    assert out.iloc[:, 19:].isna().all().all()
+
+
+def test_read_solrad_non_ascii(tmp_path):
+    # a non-ASCII character after the last column on a later line
+    with open(testfile) as f:
+        lines = f.read().splitlines()
+    lines[2:] = [line + '  ' for line in lines[2:]]
+    lines[-1] = lines[-1][:-1] + '\N{DEGREE SIGN}'
+    filename = tmp_path / 'abq19056.dat'
+    filename.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    expected, _ = solrad.read_solrad(testfile)
+    out, _ = solrad.read_solrad(filename)
+    assert_frame_equal(out, expected)
+
+
 @pytest.mark.remote_data
 @pytest.mark.flaky(reruns=RERUNS, reruns_delay=RERUNS_DELAY)
 def test_read_solrad_https():
@@ -24,6 +24,21 @@ def test__numdiff():
     assert np.allclose(iv.d2IdV2, d2f, equal_nan=True)
 
 
+@pytest.mark.parametrize('x', [
+    np.array([0., 0.1, 0.35, 0.4, 0.8, 1.3, 1.45, 2., 2.7, 3.]),
+    np.linspace(0., 3., 10)])
+def test__numdiff_polynomial(x):
+    # the 5-point formulas are exact for polynomials up to 4th order, for
+    # unequally and equally spaced points
+    f = 2. - x + 0.5 * x**2 - 0.3 * x**3 + 0.1 * x**4
+    df, d2f = _numdiff(x, f)
+    expected_df = -1. + x - 0.9 * x**2 + 0.4 * x**3
+    expected_d2f = 1. - 1.8 * x + 1.2 * x**2
+    assert np.allclose(df[2:-2], expected_df[2:-2], rtol=1e-10)
+    assert np.allclose(d2f[2:-2], expected_d2f[2:-2], rtol=1e-10)
+    assert np.all(np.isnan(df[:2])) and np.all(np.isnan(df[-2:]))
+
+
 def test_rectify_iv_curve(ivcurve):
     voltage, current = ivcurve
 
@@ -74,6 +74,14 @@ def test_get_reference_spectra_invalid_reference():
         spectrum.get_reference_spectra(standard="invalid")
 
 
+def test_get_reference_spectra_cached():
+    # test that modifying a returned spectrum doesn't affect later calls
+    first = spectrum.get_reference_spectra()
+    first.iloc[:, :] = 0
+    second = spectrum.get_reference_spectra()
+    assert (second.sum() > 0).all()
+
+
 def test_average_photon_energy_series():
     # test that the APE is calculated correctly with single spectrum
     # series input
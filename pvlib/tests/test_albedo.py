@@ -12,6 +12,7 @@ def test_inland_water_dvoracek_default():
                                           color_coeff=0.13,
                                           wave_roughness_coeff=0.29)
     assert_allclose(result, 0.072, 0.001)
+    assert isinstance(result, np.float64)
 
 
 def test_inland_water_dvoracek_negative_elevation():
@@ -64,6 +65,19 @@ def test_inland_water_dvoracek_series_mix_with_array():
     assert_series_equal(expected, result, atol=1e-5)
 
 
+@pytest.mark.parametrize('surface_condition', albedo.WATER_COLOR_COEFFS)
+def test_inland_water_dvoracek_scalar_coeffs(surface_condition):
+    # the array path with scalar coefficients matches the power formula
+    solar_elevs = np.linspace(-10, 90, 101)
+    color_coeff = albedo.WATER_COLOR_COEFFS[surface_condition]
+    roughness_coeff = albedo.WATER_ROUGHNESS_COEFFS[surface_condition]
+    result = albedo.inland_water_dvoracek(solar_elevation=solar_elevs,
+                                          surface_condition=surface_condition)
+    expected = color_coeff ** (
+        roughness_coeff * np.sin(np.radians(np.maximum(solar_elevs, 0))) + 1)
+    assert_allclose(result, expected, rtol=1e-14)
+
+
 def test_inland_water_dvoracek_invalid():
     with pytest.raises(ValueError, match='Either a `surface_condition` has to '
                        'be chosen or a combination of `color_coeff` and'
@@ -123,6 +123,22 @@ def test_martin_ruiz():
     assert_series_equal(iam, expected)
 
 
+@pytest.mark.parametrize('model,kwargs', [
+    ('physical', {}),
+    ('physical', {'n_ar': 1.29}),
+    ('martin_ruiz', {}),
+    ('ashrae', {}),
+    ('schlick', {}),
+])
+def test_iam_float32(model, kwargs):
+    # float32 aoi should give float32 iam, close to the float64 result
+    aoi = np.linspace(0, 90, 91)
+    iam_model = getattr(_iam, model)
+    iam32 = iam_model(aoi.astype(np.float32), **kwargs)
+    assert iam32.dtype == np.float32
+    assert_allclose(iam32, iam_model(aoi, **kwargs), atol=1e-6)
+
+
 def test_martin_ruiz_exception():
 
     with pytest.raises(ValueError):
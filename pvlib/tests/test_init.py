@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+import pvlib
+
+
+def test_lazy_submodules():
+    # importing pvlib alone shouldn't import the submodules
+    code = ('import sys; import pvlib; '
+            'assert "pvlib.spectrum" not in sys.modules; '
+            'assert pvlib.spectrum.__name__ == "pvlib.spectrum"')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_dir():
+    assert 'irradiance' in dir(pvlib)
+    assert '__version__' in dir(pvlib)
+
+
+def test_getattr_invalid():
+    with pytest.raises(AttributeError, match="no attribute 'not_a_module'"):
+        pvlib.not_a_module
@@ -109,6 +109,18 @@ def test_get_clearsky_ineichen_supply_linke(mocker):
     assert (out.columns.values == ['ghi', 'dni', 'dhi']).all()
 
 
+def test_get_clearsky_ineichen_misaligned():
+    # inputs with different indexes are aligned as before
+    tus = Location(32.2, -111, 'US/Arizona', 700)
+    times = pd.date_range(start='2014-06-24-0700', end='2014-06-25-0700',
+                          freq='3h')
+    solpos = tus.get_solarposition(times)
+    out = tus.get_clearsky(times[1:], solar_position=solpos)
+    assert_index_equal(out.index, times)
+    assert out.iloc[0].isnull().all()
+    assert out.iloc[1:].notnull().all().all()
+
+
 def test_get_clearsky_haurwitz(times):
     tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
     clearsky = tus.get_clearsky(times, model='haurwitz')
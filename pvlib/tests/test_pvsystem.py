@@ -155,6 +155,14 @@ def test_retrieve_sam_databases():
         assert item_per_database[database] in data.columns
 
 
+def test_retrieve_sam_cached():
+    # modifying a retrieved database must not affect later calls
+    first = pvsystem.retrieve_sam('SandiaMod')
+    first.loc['A0'] = 0
+    second = pvsystem.retrieve_sam('SandiaMod')
+    assert (second.loc['A0'] != 0).all()
+
+
 def test_sapm(sapm_module_params):
 
     times = pd.date_range(start='2015-01-01', periods=5, freq='12h')
@@ -188,6 +188,22 @@ def test_kimber_manwash(greensboro_rain, expected_kimber_manwash):
         expected_kimber_manwash['soiling'].values)
 
 
+def test_kimber_manwash_duplicate_index():
+    times = pd.date_range('2020-01-01', periods=240, freq='h')
+    times = times.append(times[[100, 101]]).sort_values()
+    rainfall = pd.Series(0., index=times)
+    manwash = [datetime.date(2020, 1, 5), ]
+    soiling = kimber(rainfall, manual_wash_dates=manwash)
+    assert soiling['2020-01-05 00:00'] == 0
+    assert soiling['2020-01-05 01:00'] < soiling['2020-01-04 23:00']
+
+
+def test_kimber_manwash_not_in_index(greensboro_rain):
+    manwash = [datetime.date(1991, 2, 15), ]
+    with pytest.raises(KeyError, match='not in index'):
+        kimber(greensboro_rain, manual_wash_dates=manwash)
+
+
 @pytest.fixture
 def expected_kimber_norain():
     # expected soiling reaches maximum
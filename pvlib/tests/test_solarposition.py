@@ -563,6 +563,14 @@ def test_nrel_earthsun_distance(delta_t):
         assert_series_equal(expected, result)
 
 
+def test__calculate_deltat():
+    times = pd.date_range(start='1998-11-15', end='2001-02-15', freq='5D',
+                          tz='UTC')
+    expected = spa.calculate_deltat(times.year, times.month)
+    result = solarposition._calculate_deltat(spa, times)
+    assert_allclose(result, expected, rtol=0, atol=0)
+
+
 def test_equation_of_time():
     times = pd.date_range(start="1/1/2015 0:00", end="12/31/2015 23:00",
                           freq="h")